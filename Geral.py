@@ -1,5 +1,6 @@
 import streamlit as st
-from PIL import Image
+
+from utils import recursos
 
 st.set_page_config( page_title='Geral', page_icon='🏠', layout='wide' )
 
@@ -9,8 +10,7 @@ st.set_page_config( page_title='Geral', page_icon='🏠', layout='wide' )
 
 st.sidebar.markdown('# Dashboard Futsal ')
 
-image2 = Image.open(r'images/logo.png')
-st.sidebar.image( image2, use_column_width=True)
+st.sidebar.image( recursos.logo_barra_lateral(), use_column_width=True)
 
 st.sidebar.markdown("""---""")
 
@@ -1,7 +1,9 @@
 import streamlit as st
-from PIL import Image
 import pandas as pd
 
+from utils import banco, classificacao, indices, recursos
+from utils.dados import carregar_agregados, carregar_dados, carregar_indices, listar_temporadas, usar_banco
+
 st.set_page_config( page_title='Classificação', page_icon='📊', layout='wide' )
 
 
@@ -10,145 +12,12 @@ st.set_page_config( page_title='Classificação', page_icon='📊', layout='wide
 # =====================================
 
 
-# Função para traduzir os meses para português sem acentos
-def traduzir_mes(mes_ingles):
-    traducao = {
-        'January': 'Janeiro',
-        'February': 'Fevereiro',
-        'March': 'Marco',
-        'April': 'Abril',
-        'May': 'Maio',
-        'June': 'Junho',
-        'July': 'Julho',
-        'August': 'Agosto',
-        'September': 'Setembro',
-        'October': 'Outubro',
-        'November': 'Novembro',
-        'December': 'Dezembro'
-    }
-    return traducao.get(mes_ingles, mes_ingles)
-
-
-
-def add_col_mes_ano(df):    
-    # Supondo que seu DataFrame seja df e tenha uma coluna chamada 'Data'
-    df['Data'] = pd.to_datetime(df['Data'], format='%d/%m/%Y')  # Converte a coluna 'Data' para datetime
-    
-    # Criar a coluna 'Mes' com o nome do mês em inglês e traduzir para português
-    df['Mes'] = df['Data'].dt.strftime('%B')  # Extrai o mês em inglês
-    df['Mes'] = df['Mes'].apply(traduzir_mes)  # Traduz os meses para português sem acentos
-
-    # Criar a coluna 'Ano'
-    df['Ano'] = df['Data'].dt.year.astype(str)
-    
-    return df
-
-
-def n_player_matches(df_vd):
-    colunas = ['Time Vencedor', 'Time Perdedor', 'Time Empate 1', 'Time Empate 2']
-    
-    # Create a dictionary to store the number of matches each player participated in
-    players_matches = {}
-    
-    # Iterate over the columns and count the occurrences of each player
-    for coluna in colunas:
-        players = df_vd[coluna].apply(lambda x: str(x).split(', ')).explode().tolist()
-        
-        for player in players:
-            if player in players_matches:
-                players_matches[player] += 1
-            else:
-                players_matches[player] = 1
-    
-    # Remove the 'nan' key
-    if 'nan' in players_matches:
-        players_matches.pop('nan')
-
-    return players_matches
-
-
-
-def criar_tabela_pontos(df_vd):
-    # Crinado Tabela de Classificação 
-    colunas = ['Time Vencedor', 'Time Perdedor', 'Time Empate 1', 'Time Empate 2']
-    # Create a new DataFrame with players and the number of matches
-    df_players = pd.DataFrame(list(players_matches.items()), columns=['Jogador', 'Partidas'])
-    
-    # Create a dictionary to store the number of wins for each player
-    players_wins = {}
-    # Create a dictionary to store the number of losses for each player
-    players_losses = {}
-    # Create a dictionary to store the number of draws for each player
-    players_draws = {}
-    
-    # Iterate over the columns and count the occurrences of each player in wins
-    for column in colunas:
-        # Check if the column is "Winning Team"
-        if column == 'Time Vencedor':
-            players = df_vd[column].apply(lambda x: str(x).split(', ')).explode().tolist()
-            
-            for player in players:
-                if player in players_wins:
-                    players_wins[player] += 1
-                else:
-                    players_wins[player] = 1
-        # Check if the column is "Losing Team"
-        elif column == 'Time Perdedor':
-            players = df_vd[column].apply(lambda x: str(x).split(', ')).explode().tolist()
-            
-            for player in players:
-                if player in players_losses:
-                    players_losses[player] += 1
-                else:
-                    players_losses[player] = 1           
-    
-        # Check if the column contains "Draw"
-        elif 'Empate' in column:
-            players = df_vd[column].apply(lambda x: str(x).split(', ')).explode().tolist()
-            
-            for player in players:
-                if player in players_draws:
-                    players_draws[player] += 1
-                else:
-                    players_draws[player] = 1 
-                    
-    # Create the "Wins" column in the df_players DataFrame
-    df_players['Vitorias'] = df_players['Jogador'].map(players_wins).fillna(0).astype(int)
-    
-    # Create the "Losses" column in the df_players DataFrame
-    df_players['Derrotas'] = df_players['Jogador'].map(players_losses).fillna(0).astype(int)
-    
-    # Create the "Draws" column in the df_players DataFrame
-    df_players['Empates'] = df_players['Jogador'].map(players_draws).fillna(0).astype(int)
-    
-    # Create the "Points" column in the df_players DataFrame
-    df_players['Pontos'] = df_players['Vitorias'] * 3 + df_players['Empates']
-    
-    # Calculate the "Efficiency" column in the df_players DataFrame
-    df_players['Aproveitamento'] = (df_players['Pontos'] / (df_players['Partidas'] * 3)) * 100
-    df_players['Aproveitamento'] = df_players['Aproveitamento'].map('{:.2f}%'.format)
-    
-    # Use the drop method to remove the 'nan' row
-    df_players = df_players.drop(df_players[df_players['Jogador'] == 'nan'].index)
-    
-    # Sort the DataFrame based on the "Points" column in descending order
-    df_players_points = df_players.sort_values(by='Pontos', ascending=False)
-    
-    # Create the "Position" column
-    df_players_points.insert(0, 'Posicao', range(1, len(df_players) + 1))
-    
-    df_players_points = df_players_points.reset_index(drop=True)
-    
-    return df_players_points
-
-
-
-def criar_tabela_gols(df_p):
+def criar_tabela_gols(df_p, contagem_gols):
     # List of all players
     all_players = df_p['Jogador'].tolist()
     
-    # Count occurrences of each player in the 'Scorer' column
-    df_scorer = df['Goleador'].value_counts()
+    # Number of goals of each player (Series indexed by player)
+    df_scorer = contagem_gols
     
     # Convert the resulting series into a DataFrame
     df_scorer = df_scorer.reset_index()
@@ -185,12 +54,12 @@ def criar_tabela_gols(df_p):
     return(df_scorer)
 
 
-def criar_tabela_assists(df_p):
+def criar_tabela_assists(df_p, contagem_assists):
     # List of all players
     all_players = df_p['Jogador'].tolist()
     
-    # Count occurrences of each player in the 'Scorer' column
-    df_assists = df['Assistente'].value_counts()
+    # Number of assists of each player (Series indexed by player)
+    df_assists = contagem_assists
     
     # Convert the resulting series into a DataFrame
     df_assists = df_assists.reset_index()
@@ -254,34 +123,50 @@ def assists_alternate_rows(row_index, num_columns):  # Função para estilizar T
 
 # -----------------------------------Início da Estrutura Lógica do Código ----------------------------------
 
+# =====================================
+# Barra Lateral
+# =====================================
+
+
+st.sidebar.markdown('# Dashboard Futsal ')
+
+st.sidebar.image( recursos.logo_barra_lateral(), use_column_width=True)
+
+st.sidebar.markdown("""---""")
+
+# Filtro Temporada
+temporadas = listar_temporadas()
+ano = st.sidebar.selectbox("Selecione a Temporada:", temporadas, index=len(temporadas) - 1)
+
+
 # =====================================
 # Import dataset
 # =====================================
 
 
-df = pd.read_excel('dataset/Futsal_2023_gols.xlsx')
-df_vd = pd.read_excel('dataset/Futsal_2023_game_results.xlsx')
+# Apenas a partição da temporada selecionada é lida (compartilhada, somente leitura)
+df, df_vd = carregar_dados([ano])
 
 
 # =====================================
 # Limpeza do dataset
 # =====================================
 
-#Adicionado Mes e Ano aos 2 dfs
-df = add_col_mes_ano(df)
-df_vd = add_col_mes_ano(df_vd)
-
-# Criando número de partidas
-players_matches = n_player_matches(df_vd)
+# Agregados persistidos da temporada completa (atualizados a cada ingestão)
+agregados = carregar_agregados([ano])
+df_agregados_jogadores = agregados['agregados_jogadores']
+df_agregados_meses = agregados['agregados_jogadores_meses']
 
 # Criando Tabela de Pontos
-df_players_points = criar_tabela_pontos(df_vd)
+df_players_points = classificacao.tabela_pontos_agregados(df_agregados_jogadores)
 # Aplicar a estilização a Tabela Pontos
 num_columns_points = len(df_players_points.columns)
-df_points_styled = df_players_points.style.apply(lambda row: pontos_alternate_rows(row.name, num_columns_points), axis=1)
+df_points_styled = df_players_points.style \
+    .apply(lambda row: pontos_alternate_rows(row.name, num_columns_points), axis=1) \
+    .format({'Aproveitamento': classificacao.FORMATO_APROVEITAMENTO})
 
 # Criando Tabela de Goleadores
-df_players_gols = criar_tabela_gols(df_players_points)
+df_players_gols = criar_tabela_gols(df_players_points, df_agregados_jogadores.set_index('Jogador')['Gols'])
 # Aplicar a estilização a Tabela Pontos
 num_columns_gols = len(df_players_gols.columns)
 df_gols_styled = df_players_gols.style \
@@ -289,7 +174,7 @@ df_gols_styled = df_players_gols.style \
     .format({'Media': '{:.2f}'})  
 
 # Criando Tabela de Assistentes
-df_players_assists = criar_tabela_assists(df_players_points)
+df_players_assists = criar_tabela_assists(df_players_points, df_agregados_jogadores.set_index('Jogador')['Assistencias'])
 # Aplicar a estilização a Tabela Pontos
 num_columns_assists = len(df_players_assists.columns)
 df_assists_styled = df_players_assists.style \
@@ -297,25 +182,6 @@ df_assists_styled = df_players_assists.style \
     .format({'Media': '{:.2f}'})  
 
 
-# =====================================
-# Barra Lateral
-# =====================================
-
-
-st.sidebar.markdown('# Dashboard Futsal ')
-
-image2 = Image.open(r'images/logo.png')
-st.sidebar.image( image2, use_column_width=True)
-
-st.sidebar.markdown("""---""")
-# Filtro Temporada
-ano = st.sidebar.selectbox("Selecione a Temporada:", ("2023"))
-
-# Filtrar por ano
-df = df[df['Ano'] == ano]
-df_vd = df_vd[df_vd['Ano'] == ano]
-
-
 # =====================================
 # Layout Streamlit 
 # =====================================
@@ -329,19 +195,19 @@ with tab1:
     with st.container():
         col1, col2, col3, col4 = st.columns(4)
         with col1:   
-            partidas = len(df_vd)
+            partidas = agregados['agregados_locais']['N Partidas'].sum()
             col1.metric( 'N° de Partidas', partidas )
         
         with col2:   
-            jogadores = len(players_matches)
+            jogadores = len(df_players_points)
             col2.metric('N° de Jogadores', jogadores)
 
         with col3:
-            quadras = len(df_vd['Local'].unique())
+            quadras = len(agregados['agregados_locais'])
             col3.metric('N° de Quadras', quadras)
 
         with col4:   
-            gols = len(df)
+            gols = agregados['agregados_meses']['N Gols'].sum()
             col4.metric('N° Gols', gols)
             
 
@@ -372,9 +238,21 @@ with tab2:
                  horizontal = True
                  )
     
-    # Filtrando o DataFrame pela coluna 'Mes'
-    df = df[df['Mes'] == mes]
-    df_vd = df_vd[df_vd['Mes'] == mes]
+    # Filtrando o DataFrame pela coluna 'Mes' (métricas de partidas, quadras e gols)
+    if usar_banco([ano]):
+        # Filtro executado como consulta indexada no SQLite (utils.banco)
+        df, df_vd = banco.filtrar([ano], mes=mes)
+    else:
+        # Bitmap do mês (utils.indices), aplicado com uma única seleção de linhas
+        indice = carregar_indices([ano])
+        df = df.take(indices.selecionar(indice['gols'], df['Data'], mes=mes))
+        df_vd = df_vd.take(indices.selecionar(indice['resultados'], df_vd['Data'], mes=mes))
+
+    # Recorte do mês no agregado (temporada, mês, jogador) persistido na ingestão
+    df_agregados_mes = df_agregados_meses[df_agregados_meses['Mes'] == mes]
+
+    # Criando Tabela de Pontos
+    df_players_points = classificacao.tabela_pontos_agregados(df_agregados_mes)
     
     st.markdown("""---""")
     
@@ -385,9 +263,7 @@ with tab2:
             col1.metric( 'N° de Partidas', partidas )
         
         with col2:   
-            # Criando número de partidas
-            players_matches = n_player_matches(df_vd)
-            jogadores = len(players_matches)
+            jogadores = len(df_players_points)
             col2.metric('N° de Jogadores', jogadores)
 
         with col3:   
@@ -401,11 +277,11 @@ with tab2:
 
     with st.container():
         st.markdown(f'## Top Pontuadores de {mes}')
-        # Criando Tabela de Pontos
-        df_players_points = criar_tabela_pontos(df_vd)
         # Aplicar a estilização a Tabela Pontos
         num_columns_points = len(df_players_points.columns)
-        df_points_styled = df_players_points.style.apply(lambda row: pontos_alternate_rows(row.name, num_columns_points), axis=1)
+        df_points_styled = df_players_points.style \
+            .apply(lambda row: pontos_alternate_rows(row.name, num_columns_points), axis=1) \
+            .format({'Aproveitamento': classificacao.FORMATO_APROVEITAMENTO})
         st.dataframe(df_points_styled, hide_index=True)
     
     with st.container():
@@ -413,8 +289,10 @@ with tab2:
         
         with col1:
             st.markdown(f'### Top Goleadores de {mes}')              
+            # Contagem de gols do mês
+            contagem_gols = df_agregados_mes.set_index('Jogador')['Gols']
             # Criando Tabela de Goleadores
-            df_players_gols = criar_tabela_gols(df_players_points)
+            df_players_gols = criar_tabela_gols(df_players_points, contagem_gols)
             # Aplicar a estilização a Tabela Pontos
             num_columns_gols = len(df_players_gols.columns)
             df_gols_styled = df_players_gols.style \
@@ -425,8 +303,10 @@ with tab2:
 
         with col2:
             st.markdown(f'### Top Assistentes de {mes}')
+            # Contagem de assistências do mês
+            contagem_assists = df_agregados_mes.set_index('Jogador')['Assistencias']
             # Criando Tabela de Assistentes
-            df_players_assists = criar_tabela_assists(df_players_points)
+            df_players_assists = criar_tabela_assists(df_players_points, contagem_assists)
             # Aplicar a estilização a Tabela Pontos
             num_columns_assists = len(df_players_assists.columns)
             df_assists_styled = df_players_assists.style \
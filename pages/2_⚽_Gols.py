@@ -1,9 +1,11 @@
 import streamlit as st
-from PIL import Image
 import pandas as pd
 import datetime
 import plotly.express as px
 
+from utils import banco, figuras, indices, recursos, tema
+from utils.dados import carregar_dados, carregar_indices, listar_temporadas, usar_banco, versao_dados
+
 
 st.set_page_config( page_title='Gols', page_icon='⚽', layout='wide' )
 
@@ -12,137 +14,6 @@ st.set_page_config( page_title='Gols', page_icon='⚽', layout='wide' )
 # =====================================
 
 
-# Função para traduzir os meses para português sem acentos
-def traduzir_mes(mes_ingles):
-    traducao = {
-        'January': 'Janeiro',
-        'February': 'Fevereiro',
-        'March': 'Marco',
-        'April': 'Abril',
-        'May': 'Maio',
-        'June': 'Junho',
-        'July': 'Julho',
-        'August': 'Agosto',
-        'September': 'Setembro',
-        'October': 'Outubro',
-        'November': 'Novembro',
-        'December': 'Dezembro'
-    }
-    return traducao.get(mes_ingles, mes_ingles)
-
-
-
-def add_col_mes_ano(df):
-    '''
-        Adiciona as colunas Mes e Ano ao dataframe DF 
-    '''
-    # Supondo que seu DataFrame seja df e tenha uma coluna chamada 'Data'
-    df['Data'] = pd.to_datetime(df['Data'], format='%d/%m/%Y')  # Converte a coluna 'Data' para datetime
-    
-    # Criar a coluna 'Mes' com o nome do mês em inglês e traduzir para português
-    df['Mes'] = df['Data'].dt.strftime('%B')  # Extrai o mês em inglês
-    df['Mes'] = df['Mes'].apply(traduzir_mes)  # Traduz os meses para português sem acentos
-
-    # Criar a coluna 'Ano'
-    df['Ano'] = df['Data'].dt.year.astype(str)
-    
-    return df
-
-
-def n_player_matches(df_vd):
-    '''
-    
-    Retorna um Dicionário com a chave jogador e o número de jogos do mesmo.
-    
-    '''
-    colunas = ['Time Vencedor', 'Time Perdedor', 'Time Empate 1', 'Time Empate 2']
-    
-    # Create a dictionary to store the number of matches each player participated in
-    players_matches = {}
-    
-    # Iterate over the columns and count the occurrences of each player
-    for coluna in colunas:
-        players = df_vd[coluna].apply(lambda x: str(x).split(', ')).explode().tolist()
-        
-        for player in players:
-            if player in players_matches:
-                players_matches[player] += 1
-            else:
-                players_matches[player] = 1
-    
-    # Remove the 'nan' key
-    if 'nan' in players_matches:
-        players_matches.pop('nan')
-
-    return players_matches
-
-def apply_custom_styles(fig, titulo):
-    """
-    Aplica estilos personalizados ao gráfico Plotly.
-
-    Parâmetros:
-    - fig: O objeto figura Plotly a ser estilizado.
-    
-    Retorna:
-    - fig: O objeto figura Plotly estilizado.
-    """
-    # Definir os estilos personalizados
-    custom_styles = {
-        'plot_bgcolor': 'rgba(0,0,0,0)',  # Cor de fundo do gráfico
-        'paper_bgcolor': 'rgba(0,0,0,0)',  # Cor de fundo da área do "papel"
-        'xaxis': {
-            'title_font': {'color': '#ffffff'},  # Cor do título do eixo X
-            'tickfont': {'color': '#ffffff'},    # Cor dos ticks do eixo X
-            'gridcolor': '#222C36'               # Cor da grade do eixo X
-        },
-        'yaxis': {
-            'title_font': {'color': '#ffffff'},  # Cor do título do eixo Y
-            'tickfont': {'color': '#ffffff'},    # Cor dos ticks do eixo Y
-            'gridcolor': '#222C36'               # Cor da grade do eixo Y
-        },
-        'colorway': ['#C5D92A'],  # Define a cor das barras (sequência de cores)
-        'font': {'color': '#ffffff'},  # Cor padrão dos rótulos (labels)
-        'title': {  # Estilos para o título
-            'text': titulo,  # Defina o título do gráfico
-            'y': 0.95,  # Ajuste da posição vertical do título
-            'x': 0.5,  # Centraliza o título horizontalmente
-            'xanchor': 'center',
-            'yanchor': 'top',
-            'font': {'color': '#ffffff', 'size': 20}  # Define cor branca e tamanho
-        }
-    }
-    
-    # Aplicar estilos ao gráfico
-    fig.update_layout(
-        plot_bgcolor=custom_styles['plot_bgcolor'],
-        paper_bgcolor=custom_styles['paper_bgcolor'],
-        xaxis=dict(
-            title_font=custom_styles['xaxis']['title_font'],
-            tickfont=custom_styles['xaxis']['tickfont'],
-            gridcolor=custom_styles['xaxis']['gridcolor']
-        ),
-        yaxis=dict(
-            title_font=custom_styles['yaxis']['title_font'],
-            tickfont=custom_styles['yaxis']['tickfont'],
-            gridcolor=custom_styles['yaxis']['gridcolor']
-        ),
-        colorway=custom_styles['colorway'],
-        font=custom_styles['font'],
-        title=custom_styles['title'], # Adiciona o título ao gráfico
-        legend=dict(font=dict(color='white'))
-    )
-
-    # Remover bordas das barras
-    fig.update_traces(
-        marker=dict(line=dict(color='rgba(0,0,0,0)', width=0))  # Remover bordas
-    )
-
-    # Definir a cor das barras diretamente
-    fig.update_traces(marker=dict(color='#C5D92A'))  # Aqui você define a cor das barras
-    
-    return fig
-
-
 def criar_df_locations(df, df_vd):
     '''
     Retorna um novo Dataframe com as seguintes Fetures:
@@ -153,19 +24,27 @@ def criar_df_locations(df, df_vd):
         - Media
         
     '''
-    # Creating new df
-    df_locations = df[['Data']].merge(df_vd[['Data', 'Local']], on='Data')
+    # Creating new df (Local de cada gol pelo identificador da partida)
+    df_locations = df[['Partida']].assign(Local=df['Partida'].map(df_vd.set_index('Partida')['Local']))
     
-    # Group by Date and Venue, counting the number of occurrences in each group
-    df_locations = df_locations.groupby(['Data', 'Local']).size().reset_index(name='N gols')
+    # Group by Match and Venue, counting the number of occurrences in each group
+    df_locations = df_locations.groupby(['Partida', 'Local'], observed=True).size().reset_index(name='N gols')
     
     # Group by Venue and sum the number of goals in each group
-    df_locations = df_locations.groupby('Local')['N gols'].sum().reset_index(name='Total Gols')
+    df_locations = df_locations.groupby('Local', observed=True)['N gols'].sum().reset_index(name='Total Gols')
     
     
     # Add the 'Number of Matches' column to the df_sum_goals_venues DataFrame
-    df_locations['N Partidas'] = df_locations['Local'].map(df_vd['Local'].value_counts())
+    df_locations['N Partidas'] = df_vd['Local'].value_counts().reindex(df_locations['Local']).values
     
+    return completar_df_locations(df_locations)
+
+
+
+def completar_df_locations(df_locations):
+    '''
+    Adiciona as colunas Media e Local abr ao DataFrame com Local, Total Gols e N Partidas
+    '''
     # Display the resulting DataFrame
     df_locations['Media'] = df_locations['Total Gols'] / df_locations['N Partidas']
 
@@ -191,7 +70,8 @@ def grafico_barras_local(df_locations, col_1, col_2, col_2_laybel):
     # Criar o gráfico de barras com plotly express
     fig = px.bar(df_locations, x=col_1, y=col_2, 
                  labels={col_1: ' ', col_2: col_2_laybel},
-                 text=col_2)  # Adicionar rótulos nas barras
+                 text=col_2,  # Adicionar rótulos nas barras
+                 template=tema.TEMPLATE)
     
     fig.update_traces(texttemplate='<b>%{text}</b>')
     
@@ -224,14 +104,14 @@ def criar_df_tempo(df):
     }            
     
     # Agregar por mês e ano, contando o número de linhas
-    df_aggregated = df.groupby(['Mes', 'Ano']).size().reset_index(name='N Gols')
+    df_aggregated = df.groupby(['Mes', 'Ano'], observed=True).size().reset_index(name='N Gols')
     
     # Ordenar o DataFrame pela ordem dos meses e pelo ano
     df_aggregated['Mes'] = pd.Categorical(df_aggregated['Mes'], categories=months_pt, ordered=True)
     df_aggregated = df_aggregated.sort_values(['Ano', 'Mes']).reset_index(drop=True)
     
     # Verificar o número de valores únicos por data
-    df_n_jogos = df_vd.groupby('Mes')['Data'].nunique().reset_index(name='N Jogos')
+    df_n_jogos = df_vd.groupby('Mes', observed=True)['Partida'].nunique().reset_index(name='N Jogos')
     
     # Juntar os DataFrames com base na coluna 'Mes' e 'Ano'
     df_merged = pd.merge(df_aggregated, df_n_jogos, on=['Mes'], how='inner')
@@ -247,13 +127,14 @@ def criar_df_tempo(df):
 
 
 
-def grafico_barras_tempo(df_locations, col_1, col_2, col_2_laybel):
+def grafico_barras_tempo(df_tempo, col_1, col_2, col_2_laybel):
     '''
     Criar o gráfico de barras referente ao tempo dos jogos
     '''
     fig = px.bar(df_tempo, x=col_1, y=col_2,
                  text=col_2,  # Adiciona os rótulos das barras
-                 labels={col_1: ' ', col_2: col_2_laybel})
+                 labels={col_1: ' ', col_2: col_2_laybel},
+                 template=tema.TEMPLATE)
 
     fig.update_traces(texttemplate='<b>%{text}</b>')  # negrito
     
@@ -268,9 +149,10 @@ def grafico_linhas_tempo(df_tempo):
     # Plotar o gráfico de linha
     fig = px.line(df_tempo, x='Mes', y='Media',
     labels={'Mes': ' ', 'Media': 'Média de Gols'},
-    markers=True)
+    markers=True,
+    template=tema.TEMPLATE)
     
-    fig = apply_custom_styles(fig, titulo='Média de Gols por Mês')
+    fig = tema.titulo(fig, 'Média de Gols por Mês')
     
     # Atualizar a cor da linha
     fig.update_traces(line=dict(color='#C5D92A'))  # Altere 'blue' para a cor desejada
@@ -289,67 +171,7 @@ def grafico_linhas_tempo(df_tempo):
     return fig
 
 
-def adicionar_colunas_tipo_gol(df):
-    '''
-    Cria um novo df e adiciona novas colunas com finalidade de criar a coluna Tipo de Gol
-    '''
-    # Remover linhas com valores ausentes na coluna 'Placar'
-    df = df.dropna(subset=['Placar'])
-    
-    # Substituir "x" por "-"
-    df.loc[:, 'Placar'] = df['Placar'].str.replace('x', '-')
-    
-    # Dividir a coluna 'Placar' em duas colunas para subtração
-    df.loc[:, 'Time A'] = df['Placar'].str.split('-').str[0].astype(int)  # Garantir que seja int
-    df.loc[:, 'Time B'] = df['Placar'].str.split('-').str[1].astype(int)  # Garantir que seja int
-    
-    # Converter para inteiros (caso não tenha sido feito anteriormente)
-    df['Time A'] = pd.to_numeric(df['Time A'], errors='coerce').astype(int)
-    df['Time B'] = pd.to_numeric(df['Time B'], errors='coerce').astype(int)
-    
-    # Criar a coluna Resultado
-    df.loc[:, 'Resultado'] = df['Time A'] - df['Time B']
-    df.loc[:, 'Diferença'] = df['Resultado'].abs()  # Usar a diferença absoluta
-    
-    # Criar a coluna "Último à Frente"
-    df.loc[df['Resultado'] > 0, 'Último à Frente'] = 'Time A'
-    df.loc[df['Resultado'] < 0, 'Último à Frente'] = 'Time B'
-    df.loc[:, 'Último à Frente'] = df['Último à Frente'].ffill()  # Usar ffill diretamente
-    
-    # Marcar a primeira linha de cada nova data como Gol Desempate
-    df.loc[:, 'Nova Data'] = df['Data'] != df['Data'].shift(1)
-    df.loc[df['Nova Data'], 'Tipo de Gol'] = 'Gol Desempate'
-    # Remover a coluna 'Nova Data' se não for mais necessária
-    df = df.drop(columns=['Nova Data'])
-    
-    # Criar a coluna Tipo de Gol
-    
-    # Gol de Empate - Quando Resultado = 0
-    df.loc[df['Resultado'] == 0, 'Tipo de Gol'] = 'Gol de Empate'
-    
-    # Gol de Vantagem
-    df.loc[(df['Diferença'] > 1) & (df['Diferença'].diff() > 0), 'Tipo de Gol'] = 'Gol de Vantagem'
-    
-    # Gol Reduzido
-    df.loc[(df['Diferença'] > 0) & (df['Diferença'].diff() < 0), 'Tipo de Gol'] = 'Gol de Desconto'
-    
-    # Gol Desempate
-    df.loc[((df['Resultado'] == 1) | (df['Resultado'] == -1)) & (df['Resultado'].shift(1) == 0) & (df['Último à Frente'] == df['Último à Frente'].shift(1)), 'Tipo de Gol'] = 'Gol Desempate'
-    
-    # Gol de Virada
-    df.loc[((df['Resultado'] == 1) | (df['Resultado'] == -1)) & (df['Resultado'].shift(1) == 0) & (df['Último à Frente'] != df['Último à Frente'].shift(1)), 'Tipo de Gol'] = 'Gol de Virada'
-    
-    # Marcar a primeira linha de cada nova data como Gol Desempate
-    df.loc[:, 'Nova Data'] = df['Data'] != df['Data'].shift(1)
-    df.loc[df['Nova Data'], 'Tipo de Gol'] = 'Gol Desempate'
-    # Remover a coluna 'Nova Data' se não for mais necessária
-    df = df.drop(columns=['Nova Data'])
-    
-    return df
-
-
-
-def grafico_tipo_gols():
+def grafico_tipo_gols(tipo_gol):
     '''
     Cria Garfico de Barra Tipo de Gol
     '''
@@ -358,7 +180,8 @@ def grafico_tipo_gols():
     # Criar o gráfico de barras
     fig = px.bar(tipo_gol, x='Tipo de Gol', y='Count',
                  text='Count',
-                 labels={'Count': 'Gols', 'Tipo de Gol': 'Tipo de Gol',})
+                 labels={'Count': 'Gols', 'Tipo de Gol': 'Tipo de Gol',},
+                 template=tema.TEMPLATE)
     
     fig.update_traces(texttemplate='<b>%{text}</b>')  # negrito
     return fig
@@ -387,54 +210,87 @@ def criar_df_tempo_segmentos(df):
 
 
 
-def grafico_barra_segmento():
+def grafico_barra_segmento(df_segmentos):
     # Criar o gráfico de barras
     fig = px.bar(
         df_segmentos,
         x='Segmento do Jogo',
         y='Contagem',
         text='Contagem',
-        labels={'Contagem': 'Gols', 'Segmento do Jogo': ' '} 
+        labels={'Contagem': 'Gols', 'Segmento do Jogo': ' '},
+        template=tema.TEMPLATE
         )
     
     # Estilizar o gráfico
-    fig.update_traces(texttemplate='<b>%{text}</b>',
-    marker_color=['#C5D92A', '#8D9C1C', '#4F5810'])
+    fig.update_traces(texttemplate='<b>%{text}</b>')
     
     return fig
 
 
-# -----------------------------------Início da Estrutura Lógica do Código ----------------------------------
 
 # =====================================
-# Import dataset
+# Figuras com os filtros atuais (montadas só quando não estão no cache, ver utils.figuras)
 # =====================================
 
 
-df = pd.read_excel('dataset/Futsal_2023_gols.xlsx')
-df_vd = pd.read_excel('dataset/Futsal_2023_game_results.xlsx')
+def calcular_df_locations():
+    '''
+    DataFrame por local com os filtros atuais (consulta no SQLite ou contagem nas linhas filtradas)
+    '''
+    if usar_banco([ano]):
+        return completar_df_locations(banco.contar_por_local([ano], local, date_slider))
 
+    return criar_df_locations(df, df_vd)
 
-# =====================================
-# Limpeza do dataset
-# =====================================
 
 
-#Adicionado Mes e Ano aos 2 dfs
-df = add_col_mes_ano(df)
-df_vd = add_col_mes_ano(df_vd)
+def figura_local(col_2, col_2_laybel, titulo, texttemplate=None):
+    '''
+    Gráfico de barras por local com o título (ver grafico_barras_local)
+    '''
+    fig = grafico_barras_local(calcular_df_locations(), col_1='Local abr', col_2=col_2, col_2_laybel=col_2_laybel)
+    fig = tema.titulo(fig, titulo)
 
-# Criando número de partidas
-players_matches = n_player_matches(df_vd)
+    if texttemplate:
+        fig.update_traces(texttemplate=texttemplate)
+
+    return fig
 
-# Adicionar Local no df
-df = pd.merge(df, df_vd[['Data', 'Local']], on='Data', how='left')
 
-#Ajustaddo DateTime
-df['Data'] = pd.to_datetime(df['Data'], format='%d-%m-%Y')
-df_vd['Data'] = pd.to_datetime(df_vd['Data'], format='%d-%m-%Y')
+
+def figura_tempo(col_2, col_2_laybel, titulo):
+    '''
+    Gráfico de barras por mês com o título (ver grafico_barras_tempo)
+    '''
+    fig = grafico_barras_tempo(criar_df_tempo(df), col_1='Mes', col_2=col_2, col_2_laybel=col_2_laybel)
+
+    return tema.titulo(fig, titulo)
+
+
+
+def figura_tipo_gols():
+    '''
+    Gráfico dos tipos de gol com o título (ver grafico_tipo_gols)
+    '''
+    # Tipo de Gol já classificado na ingestão (utils.ingestao.classificar_gols)
+    tipo_gol = df['Tipo de Gol'].value_counts()
+    tipo_gol = tipo_gol[tipo_gol > 0].reset_index()
+
+    return tema.titulo(grafico_tipo_gols(tipo_gol), 'Contagem de Tipos de Gol')
+
+
+
+def figura_segmento():
+    '''
+    Gráfico dos gols por segmento de jogo com o título (ver grafico_barra_segmento)
+    '''
+    df_segmentos = criar_df_tempo_segmentos(df)
+
+    return tema.titulo(grafico_barra_segmento(df_segmentos), 'Gols por Segmento de Jogo')
 
 
+# -----------------------------------Início da Estrutura Lógica do Código ----------------------------------
+
 # =====================================
 # Barra Lateral
 # =====================================
@@ -442,13 +298,37 @@ df_vd['Data'] = pd.to_datetime(df_vd['Data'], format='%d-%m-%Y')
 
 st.sidebar.markdown('# Dashboard Futsal')
 
-image2 = Image.open(r'images/logo.png')
-st.sidebar.image( image2, use_column_width=True)
+st.sidebar.image( recursos.logo_barra_lateral(), use_column_width=True)
 
 st.sidebar.markdown("""---""")
 
 # Filtro Temporada
-ano = st.sidebar.selectbox("Selecione a Temporada:", ("2023"))
+temporadas = listar_temporadas()
+ano = st.sidebar.selectbox("Selecione a Temporada:", temporadas, index=len(temporadas) - 1)
+
+
+# =====================================
+# Import dataset
+# =====================================
+
+
+# Apenas a partição da temporada selecionada é lida (compartilhada, somente leitura)
+df, df_vd = carregar_dados([ano])
+
+
+# =====================================
+# Limpeza do dataset
+# =====================================
+
+
+# Adicionar Local no df (consulta pelo identificador da partida, sem alterar o df compartilhado)
+df = df.assign(Local=df['Partida'].map(df_vd.set_index('Partida')['Local']))
+
+
+# =====================================
+# Barra Lateral - Filtros
+# =====================================
+
 
 # Filtro Data
 date_slider = st.sidebar.slider(
@@ -468,17 +348,15 @@ local = st.sidebar.multiselect("Selecione os Locais:",
 # Converter o valor do date_slider para datetime64[ns] antes de usar no filtro
 date_slider = pd.to_datetime(date_slider)
 
-# Filtrar por ano
-df = df[df['Ano'] == ano]
-df_vd = df_vd[df_vd['Ano'] == ano]
-
-#Filtrar por Local
-df = df[df['Local'].isin(local)]
-df_vd = df_vd[df_vd['Local'].isin(local)]
-
-#filtro de data
-df = df.loc[df['Data'] <= date_slider ,:]
-df_vd = df_vd.loc[df_vd['Data'] <= date_slider ,:]
+if usar_banco([ano]):
+    # Filtros executados como consultas indexadas no SQLite (utils.banco)
+    df, df_vd = banco.filtrar([ano], local, date_slider)
+else:
+    # Filtros de local e data como operações sobre os índices bitmap (utils.indices),
+    # aplicados com uma única seleção de linhas em cada tabela
+    indice = carregar_indices([ano])
+    df = df.take(indices.selecionar(indice['gols'], df['Data'], local, date_slider))
+    df_vd = df_vd.take(indices.selecionar(indice['resultados'], df_vd['Data'], local, date_slider))
 
 # =====================================
 # Layout Streamlit 
@@ -490,6 +368,10 @@ if df.empty:
     st.warning(f"Não há dados disponíveis.")
 else:
 
+    # Chave das figuras no cache: o gráfico, os filtros e a versão dos dados.
+    # Com a mesma chave (em qualquer sessão) a agregação e a montagem são dispensadas.
+    filtros = (ano, tuple(sorted(local)), date_slider, versao_dados([ano]))
+
     tab1, tab2 = st.tabs(['Data e Local', 'Características dos Gols'])
     
     with tab1:
@@ -497,33 +379,20 @@ else:
             st.markdown('### Análise por Local')
             col1, col2, col3 = st.columns(3)
             with col1:
-                df_locations = criar_df_locations(df, df_vd)
-                fig = grafico_barras_local(df_locations, 
-                                           col_1='Local abr', 
-                                           col_2='N Partidas', 
-                                           col_2_laybel = 'N° de Partidas'
-                                          ) 
-                fig = apply_custom_styles(fig, titulo='Partidas por Quadra')
-                st.plotly_chart(fig)
+                fig = figuras.obter(('Partidas por Quadra',) + filtros,
+                                    lambda: figura_local('N Partidas', 'N° de Partidas', 'Partidas por Quadra'))
+                st.plotly_chart(fig, theme=None)
     
             with col2:
-                fig = grafico_barras_local(df_locations, 
-                                           col_1='Local abr', 
-                                           col_2='Total Gols', 
-                                           col_2_laybel = 'N° de Gols'
-                                          ) 
-                fig = apply_custom_styles(fig, titulo='Gols por Quadra')
-                st.plotly_chart(fig)
+                fig = figuras.obter(('Gols por Quadra',) + filtros,
+                                    lambda: figura_local('Total Gols', 'N° de Gols', 'Gols por Quadra'))
+                st.plotly_chart(fig, theme=None)
     
             with col3:
-                fig = grafico_barras_local(df_locations, 
-                                           col_1='Local abr', 
-                                           col_2='Media', 
-                                           col_2_laybel = 'Media de Gols'
-                                          ) 
-                fig = apply_custom_styles(fig, titulo='Media de Gols por Quadra')
-                fig.update_traces(texttemplate='<b>%{text:.2f}</b>')
-                st.plotly_chart(fig)
+                fig = figuras.obter(('Media de Gols por Quadra',) + filtros,
+                                    lambda: figura_local('Media', 'Media de Gols', 'Media de Gols por Quadra',
+                                                         texttemplate='<b>%{text:.2f}</b>'))
+                st.plotly_chart(fig, theme=None)
     
             # Legenda para os 3 graficos
             st.markdown('<div style="text-align: center; font-size: 12px;">Clube Geraldo Santana = CGS ------ Colégio Bom Conselho = CBC ------ Quadra Sintética PUCRS = PUCRS</div>', unsafe_allow_html=True)
@@ -532,32 +401,19 @@ else:
             st.markdown('### Análise por Data')
             col1, col2 = st.columns(2)
             with col1:
-                df_tempo = criar_df_tempo(df) 
-                fig = grafico_barras_tempo(df_locations, 
-                                           col_1='Mes', 
-                                           col_2='N Jogos', 
-                                           col_2_laybel = 'Número de Jogos'
-                                          ) 
-                # Customizar o layout
-                fig = apply_custom_styles(fig, titulo='Partidas por Mês')
-                # Mostrar o gráfico
-                st.plotly_chart(fig)
+                fig = figuras.obter(('Partidas por Mês',) + filtros,
+                                    lambda: figura_tempo('N Jogos', 'Número de Jogos', 'Partidas por Mês'))
+                st.plotly_chart(fig, theme=None)
     
             with col2:
-                fig = grafico_barras_tempo(df_locations, 
-                                           col_1='Mes', 
-                                           col_2='N Gols', 
-                                           col_2_laybel = 'Número de Gols'
-                                          ) 
-    
-                fig = apply_custom_styles(fig, titulo='Gols por Mês')
-                # Customizar o layout
-                fig.update_traces(texttemplate='<b>%{text}</b>')  # negritp
-                st.plotly_chart(fig)
+                fig = figuras.obter(('Gols por Mês',) + filtros,
+                                    lambda: figura_tempo('N Gols', 'Número de Gols', 'Gols por Mês'))
+                st.plotly_chart(fig, theme=None)
     
         with st.container():
-                fig = grafico_linhas_tempo(df_tempo)
-                st.plotly_chart(fig)
+                fig = figuras.obter(('Média de Gols por Mês',) + filtros,
+                                    lambda: grafico_linhas_tempo(criar_df_tempo(df)))
+                st.plotly_chart(fig, theme=None)
     
     with tab2:
         # Verificar se todas as linhas da coluna 'Placar' estão vazias
@@ -569,22 +425,16 @@ else:
                 st.markdown('### Característica dos Gols')
                 
             with st.container():    
-                df_tipo_gols = adicionar_colunas_tipo_gol(df)
-                tipo_gol = df_tipo_gols['Tipo de Gol'].value_counts().reset_index()
-                fig = grafico_tipo_gols()
-                fig = apply_custom_styles(fig, titulo='Contagem de Tipos de Gol')
-                st.plotly_chart(fig)
+                fig = figuras.obter(('Contagem de Tipos de Gol',) + filtros, figura_tipo_gols)
+                st.plotly_chart(fig, theme=None)
                 
             with st.container():
-                # Criar o DataFrame
-                df_segmentos = criar_df_tempo_segmentos(df)
-                fig = grafico_barra_segmento()
-                fig = apply_custom_styles(fig, titulo='Gols por Segmento de Jogo')
+                fig = figuras.obter(('Gols por Segmento de Jogo',) + filtros, figura_segmento)
                 #fig.update_traces(texttemplate='<b>%{text}</b>',
                 #marker_color=['#C5D92A', '#8D9C1C', '#4F5810'])
             
                 # Exibir o gráfico no Streamlit
-                st.plotly_chart(fig)
+                st.plotly_chart(fig, theme=None)
         
             # Legenda para os 3 graficos
             st.markdown('<div style="text-align: center; font-size: 12px;">Alguns gols não foram computados nos gráficos acima pois eles não possuiam minutagem.</div>', unsafe_allow_html=True)
\ No newline at end of file
@@ -1,10 +1,12 @@
 import streamlit as st
-from PIL import Image, ImageDraw, ImageFont
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 
+from utils import acumulados, assistencias, banco, cartao, classificacao, companheiros, cubo, figuras, indices, perfis, recursos, tema
+from utils.dados import carregar_acumulados, carregar_agregados, carregar_dados, carregar_indices, carregar_participacoes, listar_temporadas, usar_banco, versao_dados
+
 st.set_page_config( page_title='Jogador', page_icon='🏃', layout='wide' )
 
 # =====================================
@@ -12,303 +14,48 @@ st.set_page_config( page_title='Jogador', page_icon='🏃', layout='wide' )
 # =====================================
 
 
-# Função para traduzir os meses para português sem acentos
-def traduzir_mes(mes_ingles):
-    traducao = {
-        'January': 'Janeiro',
-        'February': 'Fevereiro',
-        'March': 'Marco',
-        'April': 'Abril',
-        'May': 'Maio',
-        'June': 'Junho',
-        'July': 'Julho',
-        'August': 'Agosto',
-        'September': 'Setembro',
-        'October': 'Outubro',
-        'November': 'Novembro',
-        'December': 'Dezembro'
-    }
-    return traducao.get(mes_ingles, mes_ingles)
-
-
-
-def add_col_mes_ano(df):    
-    # Supondo que seu DataFrame seja df e tenha uma coluna chamada 'Data'
-    df['Data'] = pd.to_datetime(df['Data'], format='%d/%m/%Y')  # Converte a coluna 'Data' para datetime
-    
-    # Criar a coluna 'Mes' com o nome do mês em inglês e traduzir para português
-    df['Mes'] = df['Data'].dt.strftime('%B')  # Extrai o mês em inglês
-    df['Mes'] = df['Mes'].apply(traduzir_mes)  # Traduz os meses para português sem acentos
-
-    # Criar a coluna 'Ano'
-    df['Ano'] = df['Data'].dt.year.astype(str)
-    
-    return df
-
-
-
-def listar_jogadores(df_vd):
-    colunas = ['Time Vencedor', 'Time Perdedor', 'Time Empate 1', 'Time Empate 2']
-    
-    # Usar um conjunto para armazenar jogadores únicos
-    jogadores = set()
-    
-    # Iterar sobre as colunas e coletar jogadores
-    for coluna in colunas:
-        # Extrair os jogadores, dividir e adicionar ao conjunto
-        players = df_vd[coluna].apply(lambda x: str(x).split(', ')).explode().tolist()
-        jogadores.update(players)  # Atualiza o conjunto com jogadores da coluna
-
-    # Remover 'nan' se estiver presente
-    jogadores.discard('nan')
-    
-    return list(jogadores)  # Retornar a lista de jogadores únicos
-
-
-def n_player_matches(df_vd):
-    colunas = ['Time Vencedor', 'Time Perdedor', 'Time Empate 1', 'Time Empate 2']
-    
-    # Create a dictionary to store the number of matches each player participated in
-    players_matches = {}
-    
-    # Iterate over the columns and count the occurrences of each player
-    for coluna in colunas:
-        players = df_vd[coluna].apply(lambda x: str(x).split(', ')).explode().tolist()
-        
-        for player in players:
-            if player in players_matches:
-                players_matches[player] += 1
-            else:
-                players_matches[player] = 1
-    
-    # Remove the 'nan' key
-    if 'nan' in players_matches:
-        players_matches.pop('nan')
-
-    return players_matches
-
+def listar_jogadores(df_participacoes):
+    '''
+        Retorna a lista de jogadores únicos a partir da tabela de participações
+    '''
+    return df_participacoes['Jogador'].unique().tolist()
 
 
-def criar_tabela_pontos(df_vd):
-    # Crinado Tabela de Classificação 
-    colunas = ['Time Vencedor', 'Time Perdedor', 'Time Empate 1', 'Time Empate 2']
-    # Create a new DataFrame with players and the number of matches
-    df_players = pd.DataFrame(list(players_matches.items()), columns=['Jogador', 'Partidas'])
-    
-    # Create a dictionary to store the number of wins for each player
-    players_wins = {}
-    # Create a dictionary to store the number of losses for each player
-    players_losses = {}
-    # Create a dictionary to store the number of draws for each player
-    players_draws = {}
-    
-    # Iterate over the columns and count the occurrences of each player in wins
-    for column in colunas:
-        # Check if the column is "Winning Team"
-        if column == 'Time Vencedor':
-            players = df_vd[column].apply(lambda x: str(x).split(', ')).explode().tolist()
-            
-            for player in players:
-                if player in players_wins:
-                    players_wins[player] += 1
-                else:
-                    players_wins[player] = 1
-        # Check if the column is "Losing Team"
-        elif column == 'Time Perdedor':
-            players = df_vd[column].apply(lambda x: str(x).split(', ')).explode().tolist()
-            
-            for player in players:
-                if player in players_losses:
-                    players_losses[player] += 1
-                else:
-                    players_losses[player] = 1           
-    
-        # Check if the column contains "Draw"
-        elif 'Empate' in column:
-            players = df_vd[column].apply(lambda x: str(x).split(', ')).explode().tolist()
-            
-            for player in players:
-                if player in players_draws:
-                    players_draws[player] += 1
-                else:
-                    players_draws[player] = 1 
-                    
-    # Create the "Wins" column in the df_players DataFrame
-    df_players['Vitorias'] = df_players['Jogador'].map(players_wins).fillna(0).astype(int)
-    
-    # Create the "Losses" column in the df_players DataFrame
-    df_players['Derrotas'] = df_players['Jogador'].map(players_losses).fillna(0).astype(int)
-    
-    # Create the "Draws" column in the df_players DataFrame
-    df_players['Empates'] = df_players['Jogador'].map(players_draws).fillna(0).astype(int)
-    
-    # Create the "Points" column in the df_players DataFrame
-    df_players['Pontos'] = df_players['Vitorias'] * 3 + df_players['Empates']
-    
-    # Calculate the "Efficiency" column in the df_players DataFrame
-    df_players['Aproveitamento'] = (df_players['Pontos'] / (df_players['Partidas'] * 3)) * 100
-    df_players['Aproveitamento'] = df_players['Aproveitamento'].map('{:.2f}%'.format)
-    
-    # Use the drop method to remove the 'nan' row
-    df_players = df_players.drop(df_players[df_players['Jogador'] == 'nan'].index)
-    
-    # Sort the DataFrame based on the "Points" column in descending order
-    df_players_points = df_players.sort_values(by='Pontos', ascending=False)
-    
-    # Create the "Position" column
-    df_players_points.insert(0, 'Posicao', range(1, len(df_players) + 1))
-    
-    df_players_points = df_players_points.reset_index(drop=True)
-    
-    return df_players_points
+def n_player_matches(df_participacoes):
+    '''
+        Retorna uma Series com o número de partidas de cada jogador, a partir da
+        tabela de participações (uma linha por jogador em cada partida)
+    '''
+    return df_participacoes.groupby('Jogador', observed=True).size()
 
 
 
-def hex_to_rgb(hex_color):
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+@st.cache_resource(max_entries=64, show_spinner=False)
+def renderizar_cartao(jogador, numeros, diretorio):
+    '''
+        Card do jogador (ver utils.cartao) em PNG, guardado em memória por
+        jogador e valores exibidos (LRU compartilhado entre as sessões).
+        Com o cache em disco ativo, lê o card gerado antecipadamente
+        (python -m utils.cartao) do diretório da temporada.
+    '''
+    return cartao.renderizar(jogador, numeros, diretorio)
 
 
 
 def plot_player_img():
-    # Definir valores padrão (0) caso o jogador não tenha jogado ainda
-    n_partidas = str(df_players_points.loc[df_players_points['Jogador'] == jogador, 'Partidas'].values[0]) if not df_players_points.loc[df_players_points['Jogador'] == jogador, 'Partidas'].empty else '0'
-    n_pontos = str(df_players_points.loc[df_players_points['Jogador'] == jogador, 'Pontos'].values[0]) if not df_players_points.loc[df_players_points['Jogador'] == jogador, 'Pontos'].empty else '0'
-    n_win = str(df_players_points.loc[df_players_points['Jogador'] == jogador, 'Vitorias'].values[0]) if not df_players_points.loc[df_players_points['Jogador'] == jogador, 'Vitorias'].empty else '0'
-    n_draw = str(df_players_points.loc[df_players_points['Jogador'] == jogador, 'Empates'].values[0]) if not df_players_points.loc[df_players_points['Jogador'] == jogador, 'Empates'].empty else '0'
-    n_lose = str(df_players_points.loc[df_players_points['Jogador'] == jogador, 'Derrotas'].values[0]) if not df_players_points.loc[df_players_points['Jogador'] == jogador, 'Derrotas'].empty else '0'
-    # Ajustar a lógica para a participação direta corretamente
-    n_gols = df[df['Goleador'] == jogador].shape[0]  # Número de gols
-    n_assists = df[df['Assistente'] == jogador].shape[0]  # Número de assistências
-    
-    # Se o jogador tiver pelo menos 1 gol ou 1 assistência, a participação direta será a soma
-    # Caso contrário, será 0
-    n_part_diret = str(n_gols + n_assists) if (n_gols + n_assists) > 0 else '0'
-    
-    # Converter para string para exibir no gráfico
-    n_gols = str(n_gols)
-    n_assists = str(n_assists)
+    # Linha do jogador na tabela de perfis (zeros caso o jogador não tenha jogado ainda)
+    linha = perfis.perfil(df_perfis, jogador)
+    diretorio = cartao.diretorio_temporada(ano) if cartao.disco_ativo() else None
 
-    
-    
-    # Carregar a imagem
-    img = Image.open('images/player.jpg')
-    
-    # Criar um objeto de desenho
-    d = ImageDraw.Draw(img)
-    
-    # Dicionário de valores, cores, tamanhos, estilos e alinhamento
-    values_colors_sizes_styles = {
-        "nome_jogador": {"value": jogador.upper(), "color": "#161620", "size": 70, "italic": True, "align": "left"}, 
-        "n_partidas": {"value": n_partidas, "color": "#FFFFFF", "size": 100, "italic": True, "align": "center"},   
-        "n_pontos": {"value": n_pontos, "color": "#C5D92A", "size": 95, "italic": True, "align": "center"},  
-        "n_win": {"value": n_win, "color": "#00B050", "size": 70, "italic": False, "align": "center"},   
-        "n_draw": {"value": n_draw, "color": "#FFC000", "size": 70, "italic": False, "align": "center"},  
-        "n_lose": {"value": n_lose, "color": "#C00000", "size": 70, "italic": False, "align": "center"},   
-        "n_part_diret": {"value": n_part_diret, "color": "#FFFFFF", "size": 85, "italic": True, "align": "center"},
-        "n_gols": {"value": n_gols, "color": "#ED7D31", "size": 35, "italic": False, "align": "center"},   
-        "n_assists": {"value": n_assists, "color": "#38DBCC", "size": 35, "italic": False, "align": "center"}
-    }
-    
-    # Definir as posições onde os valores serão inseridos
-    positions = [(100, 65), (108, 222), (230, 385), (115, 555), (228, 555), 
-                 (341, 555), (963, 120), (536, 460), (1182, 330)]
-    
-    # Adicionar os valores na imagem com suas respectivas cores, tamanhos, estilos e alinhamento
-    for i, props in enumerate(values_colors_sizes_styles.values()):
-        value = props['value']  # Pega o valor real para ser exibido
-        rgb_color = hex_to_rgb(props['color'])  # Converte a cor hexadecimal para RGB
-        
-        # Carregar a fonte com base no estilo
-        if props['italic']:
-            font = ImageFont.truetype('fonts/source-sans-pr-boldItalic.ttf', size=props['size'])  # Fonte itálica
-        else:
-            font = ImageFont.truetype('fonts/source-sans-pro-bold.ttf', size=props['size'])  # Fonte em negrito
-    
-        # Calcular a largura do texto para ajustar o alinhamento
-        text_bbox = d.textbbox((0, 0), value, font=font)
-        text_width = text_bbox[2] - text_bbox[0]  # Largura do texto
-        
-        # Ajustar a posição com base no alinhamento
-        if props['align'] == "center":
-            x = positions[i][0] - text_width // 2  # Centralizado
-        elif props['align'] == "right":
-            x = positions[i][0] - text_width  # Alinhado à direita
-        else:  # Padrão é à esquerda
-            x = positions[i][0]
-    
-        y = positions[i][1]
-        
-        # Desenhar o texto na imagem
-        d.text((x, y), value, font=font, fill=rgb_color)
-    
-    # Exibir a imagem no Streamlit
-    st.image(img, use_column_width=True)    
-
-
-
-def apply_custom_styles(fig, titulo):
-    """
-    Aplica estilos personalizados ao gráfico Plotly.
-
-    Parâmetros:
-    - fig: O objeto figura Plotly a ser estilizado.
-    
-    Retorna:
-    - fig: O objeto figura Plotly estilizado.
-    """
-    # Definir os estilos personalizados
-    custom_styles = {
-        'plot_bgcolor': 'rgba(0,0,0,0)',  # Cor de fundo do gráfico
-        'paper_bgcolor': 'rgba(0,0,0,0)',  # Cor de fundo da área do "papel"
-        'xaxis': {
-            'title_font': {'color': '#ffffff'},  # Cor do título do eixo X
-            'tickfont': {'color': '#ffffff'},    # Cor dos ticks do eixo X
-            'gridcolor': '#222C36'               # Cor da grade do eixo X
-        },
-        'yaxis': {
-            'title_font': {'color': '#ffffff'},  # Cor do título do eixo Y
-            'tickfont': {'color': '#ffffff'},    # Cor dos ticks do eixo Y
-            'gridcolor': '#222C36'               # Cor da grade do eixo Y
-        },
-        'font': {'color': '#ffffff'},  # Cor padrão dos rótulos (labels)
-        'title': {  # Estilos para o título
-            'text': titulo,  # Defina o título do gráfico
-            'y': 0.95,  # Ajuste da posição vertical do título
-            'x': 0.5,  # Centraliza o título horizontalmente
-            'xanchor': 'center',
-            'yanchor': 'top',
-            'font': {'color': '#ffffff', 'size': 20}  # Define cor branca e tamanho
-        }
-    }
-    
-    # Aplicar estilos ao gráfico
-    fig.update_layout(
-        plot_bgcolor=custom_styles['plot_bgcolor'],
-        paper_bgcolor=custom_styles['paper_bgcolor'],
-        xaxis=dict(
-            title_font=custom_styles['xaxis']['title_font'],
-            tickfont=custom_styles['xaxis']['tickfont'],
-            gridcolor=custom_styles['xaxis']['gridcolor']
-        ),
-        yaxis=dict(
-            title_font=custom_styles['yaxis']['title_font'],
-            tickfont=custom_styles['yaxis']['tickfont'],
-            gridcolor=custom_styles['yaxis']['gridcolor']
-        ),
-        font=custom_styles['font'],
-        title=custom_styles['title'],  # Adiciona o título ao gráfico
-        legend=dict(font=dict(color='white'))
-    )
-
-    return fig
+    # Exibir a imagem no Streamlit (bytes PNG servidos sem recodificar)
+    st.image(renderizar_cartao(jogador, cartao.valores(linha), diretorio), use_column_width=True, output_format='PNG')
 
 
 
 def grafico_pie(df):
     # Definir os valores de gols e assistências
-    gols = df[df['Goleador'] == jogador].shape[0]
-    assistencias = df[df['Assistente'] == jogador].shape[0]
+    linha = perfis.perfil(df_perfis, jogador)
+    gols, assistencias = linha['Gols'], linha['Assistencias']
     
     # Criar o gráfico de pizza
     valores = [gols, assistencias]
@@ -322,32 +69,28 @@ def grafico_pie(df):
                                  marker=dict(colors=cores),
                                  texttemplate='<b>%{percent:.1%}</b><br>%{value} %{label}</br>',  # Exibe porcentagem e label
                                  textfont=dict(size=14, color='#161620')  # Define o tamanho da fonte
-                                )])  
+                                )],
+                    layout=dict(template=tema.TEMPLATE))  
     return fig
 
 
 
-def contar_companheiros(df_vd):
+@st.cache_resource(max_entries=32, show_spinner=False)
+def calcular_matriz_companheiros(df_participacoes):
+    '''
+        Matriz de companheiros (ver utils.companheiros) das participações
+        filtradas, calculada uma vez por estado dos filtros e compartilhada
+        entre os jogadores selecionados (somente leitura)
+    '''
+    return companheiros.matriz_companheiros(df_participacoes)
+
+
+
+def contar_companheiros(df_companheiros):
     '''
         Conta o número de vezes que o jogador analisado jogou com cada companheiro.
     '''
-    # Criar uma lista para armazenar as linhas que contêm exclusivamente o jogador 
-    contagem_jogadores = []
-    
-    # Percorrer as colunas relevantes e verificar a presença exata do jogador
-    for _, row in df_vd.iterrows():
-        for col in ["Time Vencedor", "Time Perdedor", "Time Empate 1", "Time Empate 2"]:
-            players = [player.strip() for player in str(row[col]).split(',')]
-            if any(player == jogador for player in players):
-                contagem_jogadores.append([p.strip() for p in players if p.strip() != jogador])
-    
-    # Excluir o jogador da lista
-    contagem_jogadores = [player for players in contagem_jogadores for player in players]
-    
-    # Contar a frequência de cada jogador
-    players_count = pd.Series(contagem_jogadores).value_counts()
-    
-    return players_count
+    return df_companheiros['Partidas'].sort_values(ascending=False, kind='stable')
 
 
 
@@ -363,7 +106,8 @@ def grafico_companheiros_frequentes(players_count):
     # Criar o gráfico de barras verticais
     fig = px.bar(df_players, x='Jogador', y='Count', 
                  labels={'Count': 'Quantidade de Jogos', 'Jogador': ' '},
-                 color_discrete_sequence=['#C5D92A'])  
+                 color_discrete_sequence=['#C5D92A'],
+                 template=tema.TEMPLATE)  
     
     # Adicionar rótulos com os valores em negrito e sem casas decimais
     fig.update_traces(text=df_players['Count'].astype(int).astype(str), textposition='auto')
@@ -375,113 +119,60 @@ def grafico_companheiros_frequentes(players_count):
 
 
 
-def gerar_listas(df_vd):
+def gerar_listas(df_companheiros):
     '''
         Gera as listas necessárias para criação do grafico de aproveitamento por
         companheiro de time do jogado analisado
     '''
-    # Criar listas para armazenar os jogadores em diferentes situações
-    companheiros_v = []
-    companheiros_d = []
-    companheiros_e = []
-
-    # Percorrer as colunas relevantes e verificar a presença exata do jogador
-    for _, row in df_vd.iterrows():
-        for col in ["Time Vencedor", "Time Perdedor", "Time Empate 1", "Time Empate 2"]:
-            players = [player.strip() for player in str(row[col]).split(',')]
-            if any(player == jogador for player in players):
-                if col == "Time Vencedor":
-                    companheiros_v.extend([p.strip() for p in players if p.strip() != jogador])
-                elif col == "Time Perdedor":
-                    companheiros_d.extend([p.strip() for p in players if p.strip() != jogador])
-                elif col in ["Time Empate 1", "Time Empate 2"]:
-                    companheiros_e.extend([p.strip() for p in players if p.strip() != jogador])
-
-    # Contar a frequência de cada jogador em cada lista
-    players_count_v = pd.Series(companheiros_v).value_counts()
-    players_count_d = pd.Series(companheiros_d).value_counts()
-    players_count_e = pd.Series(companheiros_e).value_counts()
-
-    # Criar um DataFrame consolidado com as contagens
-    df_plot = pd.DataFrame({
-        'Time Vencedor': players_count_v,
-        'Time Perdedor': players_count_d,
-        'Time Empate': players_count_e
-    }).fillna(0)
-
-    # Transformando em int
-    df_plot['Time Vencedor'] = df_plot['Time Vencedor'].astype(int)
-    df_plot['Time Perdedor'] = df_plot['Time Perdedor'].astype(int)
-    df_plot['Time Empate'] = df_plot['Time Empate'].astype(int)
-
-    # Criando coluna Jogos
-    df_plot['Jogos'] = df_plot['Time Vencedor'] + df_plot['Time Perdedor'] + df_plot['Time Empate']
-
-    # Criando coluna Pontos
-    df_plot['Pontos'] = df_plot['Time Vencedor'] * 3 + df_plot['Time Empate']
-
-    # Calcular a coluna "Aproveitamento"
-    df_plot['Aproveitamento'] = (df_plot['Pontos'] / (df_plot['Jogos'] * 3)) * 100
-    df_plot['Aproveitamento'] = df_plot['Aproveitamento'].map('{:.0f}%'.format)
-
-    # Criando as listas para retorno
+    # Vitórias, derrotas, empates, pontos e aproveitamento de cada companheiro ao lado do jogador
+    df_plot = classificacao.calcular_pontos(df_companheiros.copy())
+
+    # Criando as listas para retorno (aproveitamento numérico, formatado no gráfico)
     jogadores = df_plot.index.tolist()
-    derrotas = df_plot['Time Perdedor'].tolist()
-    empates = df_plot['Time Empate'].tolist()
-    vitorias = df_plot['Time Vencedor'].tolist()
+    derrotas = df_plot['Derrotas'].tolist()
+    empates = df_plot['Empates'].tolist()
+    vitorias = df_plot['Vitorias'].tolist()
     aproveitamento = df_plot['Aproveitamento'].tolist()
-    jogos = df_plot['Jogos'].tolist()
+    jogos = df_plot['Partidas'].tolist()
 
     return jogadores, derrotas, empates, vitorias, aproveitamento, jogos
 
 
 
-def grafico_companheiros_aproveitamento():
+def grafico_companheiros_aproveitamento(jogadores, derrotas, empates, vitorias, aproveitamento, jogos):
     '''
         Criação do grafico de aproveitamento por
         companheiro de time do jogado analisado
     '''
-    # Criando o gráfico
-    fig = go.Figure()
-    
-    # Adicionando barras
-    fig.add_trace(go.Bar(
-        x=jogadores,
-        y=derrotas,
-        name='Derrotas',
-        marker_color='#960000'
-    ))
-    
-    fig.add_trace(go.Bar(
-        x=jogadores,
-        y=empates,
-        name='Empates',
-        marker_color='#E8D806'
-    ))
-    
-    fig.add_trace(go.Bar(
-        x=jogadores,
-        y=vitorias,
-        name='Vitórias',
-        marker_color='#00B050'
-    ))
-    
-    # Adicionando rótulos com texto em negrito
-    for i, (player, derrota, empate, vitoria, jogo, aproveitamento_val) in enumerate(zip(jogadores, derrotas, empates, vitorias, jogos, aproveitamento)):
+    # Rótulos em negrito: valor no meio de cada segmento não vazio e aproveitamento
+    # acima da barra. Montados como dicionários e passados de uma vez no layout
+    # (um add_annotation por rótulo revalida a figura a cada chamada)
+    margem = max(jogos, default=0) / 25
+    rotulos = []
+    for player, derrota, empate, vitoria, aproveitamento_val in zip(jogadores, derrotas, empates, vitorias, aproveitamento):
         if derrota != 0:
-            fig.add_annotation(x=player, y=derrota / 2, text=f'<b>{derrota}</b>', showarrow=False, font=dict(color='white', size=13))
+            rotulos.append(dict(x=player, y=derrota / 2, text=f'<b>{derrota}</b>', showarrow=False, font=dict(color='white', size=13)))
         if empate != 0:
-            fig.add_annotation(x=player, y=derrota + empate / 2, text=f'<b>{empate}</b>', showarrow=False, font=dict(color='#161620', size=13))
+            rotulos.append(dict(x=player, y=derrota + empate / 2, text=f'<b>{empate}</b>', showarrow=False, font=dict(color='#161620', size=13)))
         if vitoria != 0:
-            fig.add_annotation(x=player, y=derrota + empate + vitoria / 2, text=f'<b>{vitoria}</b>', showarrow=False, font=dict(color='white', size=13))
-        fig.add_annotation(x=player, y=derrota + empate + vitoria + max(jogos) / 25, text=f'<b>{aproveitamento_val}</b>', showarrow=False, font=dict(color='#C5D92A', size=10))
-    
-    # Configurações finais do layout
-    fig.update_layout(
-        barmode='stack',
-        xaxis_title=' ',
-        yaxis_title='Jogos',
-        xaxis_tickangle=-60,
+            rotulos.append(dict(x=player, y=derrota + empate + vitoria / 2, text=f'<b>{vitoria}</b>', showarrow=False, font=dict(color='white', size=13)))
+        rotulos.append(dict(x=player, y=derrota + empate + vitoria + margem, text=f'<b>{aproveitamento_val:.0f}%</b>', showarrow=False, font=dict(color='#C5D92A', size=10)))
+
+    # Criando o gráfico com as barras empilhadas e os rótulos
+    fig = go.Figure(
+        data=[
+            go.Bar(x=jogadores, y=derrotas, name='Derrotas', marker_color='#960000'),
+            go.Bar(x=jogadores, y=empates, name='Empates', marker_color='#E8D806'),
+            go.Bar(x=jogadores, y=vitorias, name='Vitórias', marker_color='#00B050')
+        ],
+        layout=dict(
+            template=tema.TEMPLATE,
+            annotations=rotulos,
+            barmode='stack',
+            xaxis_title=' ',
+            yaxis_title='Jogos',
+            xaxis_tickangle=-60
+        )
     )
     
     return fig
@@ -495,8 +186,6 @@ def adicionar_coluna_segmentos(df):
     '''
     #Excluir estas datas
     df = df.dropna(subset=['Placar'])
-    # Substituir "x" por "-"
-    df['Placar'] = df['Placar'].str.replace('x', '-')
     # Criando coluna "Parcela do Jogo"
     df.loc[df['Minuto'] < 20, ['Parcela do jogo']] = "Inicio"
     df.loc[(df['Minuto'] >= 20) & (df['Minuto'] < 40), 'Parcela do jogo'] = "Meio"
@@ -505,66 +194,6 @@ def adicionar_coluna_segmentos(df):
     return df
 
 
-def adicionar_colunas_tipo_gol(df):
-    '''
-    Cria um novo df e adiciona novas colunas com finalidade de criar a coluna Tipo de Gol
-    '''
-    # Remover linhas com valores ausentes na coluna 'Placar'
-    df = df.dropna(subset=['Placar'])
-    
-    # Substituir "x" por "-"
-    df.loc[:, 'Placar'] = df['Placar'].str.replace('x', '-')
-    
-    # Dividir a coluna 'Placar' em duas colunas para subtração
-    df.loc[:, 'Time A'] = df['Placar'].str.split('-').str[0].astype(int)  # Garantir que seja int
-    df.loc[:, 'Time B'] = df['Placar'].str.split('-').str[1].astype(int)  # Garantir que seja int
-    
-    # Converter para inteiros (caso não tenha sido feito anteriormente)
-    df['Time A'] = pd.to_numeric(df['Time A'], errors='coerce').astype(int)
-    df['Time B'] = pd.to_numeric(df['Time B'], errors='coerce').astype(int)
-    
-    # Criar a coluna Resultado
-    df.loc[:, 'Resultado'] = df['Time A'] - df['Time B']
-    df.loc[:, 'Diferença'] = df['Resultado'].abs()  # Usar a diferença absoluta
-    
-    # Criar a coluna "Último à Frente"
-    df.loc[df['Resultado'] > 0, 'Último à Frente'] = 'Time A'
-    df.loc[df['Resultado'] < 0, 'Último à Frente'] = 'Time B'
-    df.loc[:, 'Último à Frente'] = df['Último à Frente'].ffill()  # Usar ffill diretamente
-    
-    # Marcar a primeira linha de cada nova data como Gol Desempate
-    df.loc[:, 'Nova Data'] = df['Data'] != df['Data'].shift(1)
-    df.loc[df['Nova Data'], 'Tipo de Gol'] = 'Gol Desempate'
-    # Remover a coluna 'Nova Data' se não for mais necessária
-    df = df.drop(columns=['Nova Data'])
-    
-    # Criar a coluna Tipo de Gol
-    
-    # Gol de Empate - Quando Resultado = 0
-    df.loc[df['Resultado'] == 0, 'Tipo de Gol'] = 'Gol de Empate'
-    
-    # Gol de Vantagem
-    df.loc[(df['Diferença'] > 1) & (df['Diferença'].diff() > 0), 'Tipo de Gol'] = 'Gol de Vantagem'
-    
-    # Gol Reduzido
-    df.loc[(df['Diferença'] > 0) & (df['Diferença'].diff() < 0), 'Tipo de Gol'] = 'Gol de Desconto'
-    
-    # Gol Desempate
-    df.loc[((df['Resultado'] == 1) | (df['Resultado'] == -1)) & (df['Resultado'].shift(1) == 0) & (df['Último à Frente'] == df['Último à Frente'].shift(1)), 'Tipo de Gol'] = 'Gol Desempate'
-    
-    # Gol de Virada
-    df.loc[((df['Resultado'] == 1) | (df['Resultado'] == -1)) & (df['Resultado'].shift(1) == 0) & (df['Último à Frente'] != df['Último à Frente'].shift(1)), 'Tipo de Gol'] = 'Gol de Virada'
-    
-    # Marcar a primeira linha de cada nova data como Gol Desempate
-    df.loc[:, 'Nova Data'] = df['Data'] != df['Data'].shift(1)
-    df.loc[df['Nova Data'], 'Tipo de Gol'] = 'Gol Desempate'
-    # Remover a coluna 'Nova Data' se não for mais necessária
-    df = df.drop(columns=['Nova Data'])
-    
-    return df
-
-
-
 def contar_participacoes(df):
     """
     Conta as participações de um jogador em um DataFrame.
@@ -578,10 +207,14 @@ def contar_participacoes(df):
     # Mapear os pontos para valores numéricos
     pontos_mapping = {'Inicio': 1, 'Meio': 2, 'Fim': 3}
 
-    # Agrupar por Parcela do jogo e contar a ocorrência de cada categoria
-    parcela_counts = df[(df['Goleador'] == jogador) | (df['Assistente'] == jogador)]['Parcela do jogo'].value_counts()
-    parcela_counts_gols = df[df['Goleador'] == jogador]['Parcela do jogo'].value_counts()
-    parcela_counts_assists = df[df['Assistente'] == jogador]['Parcela do jogo'].value_counts()
+    if usar_banco([ano]):
+        # Contagens do jogador como consulta indexada no SQLite (utils.banco)
+        parcela_counts, parcela_counts_gols, parcela_counts_assists = banco.segmentos_jogador([ano], jogador, local, date_slider)
+    else:
+        # Agrupar por Parcela do jogo e contar a ocorrência de cada categoria
+        parcela_counts = df[(df['Goleador'] == jogador) | (df['Assistente'] == jogador)]['Parcela do jogo'].value_counts()
+        parcela_counts_gols = df[df['Goleador'] == jogador]['Parcela do jogo'].value_counts()
+        parcela_counts_assists = df[df['Assistente'] == jogador]['Parcela do jogo'].value_counts()
 
     # Mapear os pontos para valores numéricos nos índices
     parcela_counts.index = parcela_counts.index.map(pontos_mapping)
@@ -592,11 +225,11 @@ def contar_participacoes(df):
 
    
 
-def grafico_barra_segmento_jogador():
+def grafico_barra_segmento_jogador(parcela_counts, parcela_counts_gols, parcela_counts_assists, pontos_mapping):
     '''
         Cria o grafico de barras da distribuição de gol e assists por segmento
     '''
-    fig = go.Figure()
+    fig = go.Figure(layout=dict(template=tema.TEMPLATE))
     
     # Adicionar as barras para Participações e exibir os valores automaticamente
     fig.add_trace(go.Bar(
@@ -638,13 +271,13 @@ def grafico_barra_segmento_jogador():
         xaxis=dict(
             tickvals=list(pontos_mapping.values()),
             ticktext=list(pontos_mapping.keys()),
-            tickfont=dict(size=15, family="Arial", color="black", weight='bold'),
+            tickfont=dict(size=15, family="Arial", weight='bold'),
         ),
         yaxis=dict(
             title='Valores',  # Adicionar título ao eixo Y, se desejado
             showticklabels=True,  # Exibir labels do eixo Y
-            title_font=dict(size=15, family="Arial", color="black", weight='bold'),
-            tickfont=dict(size=12, family="Arial", color="black")  # Definir a fonte das labels do eixo Y
+            title_font=dict(size=15, family="Arial", weight='bold'),
+            tickfont=dict(size=12, family="Arial")  # Definir a fonte das labels do eixo Y
         ),
         legend=dict(
             title_text='Legenda',
@@ -657,7 +290,7 @@ def grafico_barra_segmento_jogador():
 
 
 
-def contar_tipos_gols():
+def contar_tipos_gols(df):
     """
         Conta os tipos de gols e assists de um jogador em um DataFrame.
     
@@ -670,25 +303,34 @@ def contar_tipos_gols():
     # Mapear os pontos para valores numéricos
     pontos_mapping = {'Gol de Vantagem': 1, 'Gol de Desconto': 2, 'Gol de Empate': 3, 'Gol Desempate': 4, 'Gol de Virada': 5}
     
-    # Agrupar por Parcela do jogo e contar a ocorrência de cada categoria
-    parcela_counts = df[(df['Goleador'] == jogador) | (df['Assistente'] == jogador)]['Tipo de Gol'].value_counts()
-    parcela_counts_gols = df[df['Goleador'] == jogador]['Tipo de Gol'].value_counts()
-    parcela_counts_assists = df[df['Assistente'] == jogador]['Tipo de Gol'].value_counts()
-    
+    if usar_banco([ano]):
+        # Contagens do jogador como consulta indexada no SQLite (utils.banco), já sem os tipos zerados
+        parcela_counts, parcela_counts_gols, parcela_counts_assists = banco.tipos_gol_jogador([ano], jogador, local, date_slider)
+    else:
+        # Agrupar por Tipo de Gol (já classificado na ingestão) e contar a ocorrência de cada categoria
+        parcela_counts = df[(df['Goleador'] == jogador) | (df['Assistente'] == jogador)]['Tipo de Gol'].value_counts()
+        parcela_counts_gols = df[df['Goleador'] == jogador]['Tipo de Gol'].value_counts()
+        parcela_counts_assists = df[df['Assistente'] == jogador]['Tipo de Gol'].value_counts()
+
+        # Descartar os tipos sem ocorrência (coluna categórica)
+        parcela_counts = parcela_counts[parcela_counts > 0]
+        parcela_counts_gols = parcela_counts_gols[parcela_counts_gols > 0]
+        parcela_counts_assists = parcela_counts_assists[parcela_counts_assists > 0]
+
     # Mapear os pontos para valores numéricos nos índices
-    parcela_counts.index = parcela_counts.index.map(pontos_mapping)
-    parcela_counts_gols.index = parcela_counts_gols.index.map(pontos_mapping)
-    parcela_counts_assists.index = parcela_counts_assists.index.map(pontos_mapping)
+    parcela_counts.index = parcela_counts.index.astype(object).map(pontos_mapping)
+    parcela_counts_gols.index = parcela_counts_gols.index.astype(object).map(pontos_mapping)
+    parcela_counts_assists.index = parcela_counts_assists.index.astype(object).map(pontos_mapping)
     
     return pontos_mapping, parcela_counts, parcela_counts_gols, parcela_counts_assists
 
 
-def grafico_barra_tipo_gol_jogador():
+def grafico_barra_tipo_gol_jogador(pontos_mapping, parcela_counts, parcela_counts_gols, parcela_counts_assists):
     '''
         Plota o grafico dos tipos de gols e asssists do jogador
     '''
     # Criar a figura
-    fig = go.Figure()
+    fig = go.Figure(layout=dict(template=tema.TEMPLATE))
     
     # Adicionar as barras para Participações e exibir os valores automaticamente
     fig.add_trace(go.Bar(
@@ -733,13 +375,13 @@ def grafico_barra_tipo_gol_jogador():
         xaxis=dict(
             tickvals=list(pontos_mapping.values()),
             ticktext=list(pontos_mapping.keys()),
-            tickfont=dict(size=15, family="Arial", color="black", weight='bold'),
+            tickfont=dict(size=15, family="Arial", weight='bold'),
         ),
         yaxis=dict(
             title='Valores',  # Adicionar título ao eixo Y, se desejado
             showticklabels=True,  # Exibir labels do eixo Y
-            title_font=dict(size=15, family="Arial", color="black", weight='bold'),
-            tickfont=dict(size=12, family="Arial", color="black"),  # Definir a fonte das labels do eixo Y
+            title_font=dict(size=15, family="Arial", weight='bold'),
+            tickfont=dict(size=12, family="Arial"),  # Definir a fonte das labels do eixo Y
             range=[0, y_axis_limit]  # Definir o limite do eixo Y
         ),
         legend=dict(
@@ -754,26 +396,38 @@ def grafico_barra_tipo_gol_jogador():
 
 
 
+@st.cache_resource(max_entries=32, show_spinner=False)
+def calcular_matriz_assistencias(df):
+    '''
+        Matriz goleador x assistente (ver utils.assistencias) dos gols
+        filtrados, calculada uma vez por estado dos filtros e compartilhada
+        entre os jogadores selecionados (somente leitura)
+    '''
+    return assistencias.matriz_assistencias(df)
+
+
+
 def contar_assists_jogadores(df):
-    # Filtrar o DataFrame
-    df_jogador = df[(df['Goleador'] == jogador) | (df['Assistente'] == jogador)]
-    df_jogador_gols = df[df['Goleador'] == jogador]
-    df_jogador_assists = df[df['Assistente'] == jogador]
-    
-    # Dados para os gráficos
-    assistente_counts_goleador = df_jogador[(df_jogador['Goleador'] == jogador) & (df_jogador['Assistente'] != '-')]['Assistente'].value_counts()
-    no_assistente_counts = df_jogador[df_jogador['Goleador'] == jogador][df_jogador['Assistente'] == '-']['Goleador'].value_counts()
-    assistente_counts_assistente = df_jogador_assists[df_jogador_assists['Goleador'] != "-"]['Goleador'].value_counts()
-    
+    '''
+        Retorna as assistências recebidas pelo jogador (linha da matriz), os seus
+        gols sem assistência (coluna "-") e as assistências concedidas (coluna do jogador)
+    '''
+    matriz = calcular_matriz_assistencias(df)
+
+    assistente_counts_goleador = assistencias.recebidas(matriz, jogador)
+    no_assistente_counts = assistencias.sem_assistencia(matriz, jogador)
+    assistente_counts_assistente = assistencias.concedidas(matriz, jogador)
+
     return assistente_counts_goleador, no_assistente_counts, assistente_counts_assistente
 
 
 
-def grafico_barras_assistencias():
+def grafico_barras_assistencias(assistente_counts_goleador, no_assistente_counts, assistente_counts_assistente):
     # Criar a figura
     fig = make_subplots(rows=1, cols=3, 
                         column_widths=[0.9, 0.1, 0.9],  # Ajusta as larguras para 45%, 10%, 45%
-                        subplot_titles=("Assistencias Recebidas", "Sem Assist", "Assistências Concedidas"))
+                        subplot_titles=("Assistencias Recebidas", "Sem Assist", "Assistências Concedidas"),
+                        figure=go.Figure(layout=dict(template=tema.TEMPLATE)))
     
     # Inverter a ordem das barras da esquerda
     assistente_counts_goleador_inverted = assistente_counts_goleador[::-1]
@@ -828,45 +482,66 @@ def grafico_barras_assistencias():
     
     # Ajuste de layout
     fig.update_layout(height=500, width=1000, 
-                      title_text=f"Distribuição das Assistências por Companheiros {jogador}", 
                       title_x=0.2,
+                      title_xanchor='left',  # O template centraliza o título em x
                       title_font=dict(size=20),
                       showlegend=False)
-    return fig
+    return tema.titulo(fig, f"Distribuição das Assistências por Companheiros {jogador}")
 
 
-# -----------------------------------Início da Estrutura Lógica do Código ----------------------------------
 
 # =====================================
-# Import dataset
+# Figuras com os filtros atuais (montadas só quando não estão no cache, ver utils.figuras)
 # =====================================
 
 
-df = pd.read_excel('dataset/Futsal_2023_gols.xlsx')
-df_vd = pd.read_excel('dataset/Futsal_2023_game_results.xlsx')
+def linha_companheiros():
+    '''
+        Linha do jogador na matriz de companheiros dos filtros atuais
+    '''
+    return companheiros.linha_companheiros(calcular_matriz_companheiros(df_participacoes), jogador)
 
 
-# =====================================
-# Limpeza do dataset
-# =====================================
 
+def figura_companheiros_frequentes():
+    fig = grafico_companheiros_frequentes(contar_companheiros(linha_companheiros()))
 
-#Adicionado Mes e Ano aos 2 dfs
-df = add_col_mes_ano(df)
-df_vd = add_col_mes_ano(df_vd)
+    return tema.titulo(fig, f'Companheiros mais Frequentes de {jogador}')
 
-# Criando número de partidas
-players_matches = n_player_matches(df_vd)
-players_matches2 = n_player_matches(df_vd)
 
-# Adicionar Local no df
-df = pd.merge(df, df_vd[['Data', 'Local']], on='Data', how='left')
 
-#Ajustaddo DateTime
-df['Data'] = pd.to_datetime(df['Data'], format='%d-%m-%Y')
-df_vd['Data'] = pd.to_datetime(df_vd['Data'], format='%d-%m-%Y')
+def figura_companheiros_aproveitamento():
+    fig = grafico_companheiros_aproveitamento(*gerar_listas(linha_companheiros()))
+
+    return tema.titulo(fig, f'V/E/D + Aproveitamento por Comapanheiro de {jogador}')
+
+
+
+def figura_pie():
+    return tema.titulo(grafico_pie(df), f'Contagem de Tipos de Gol de {jogador}')
+
+
+
+def figura_segmento_jogador():
+    fig = grafico_barra_segmento_jogador(*contar_participacoes(adicionar_coluna_segmentos(df)))
+
+    return tema.titulo(fig, f'Participações de acordo com período de jogo - {jogador}')
+
 
 
+def figura_tipo_gol_jogador():
+    fig = grafico_barra_tipo_gol_jogador(*contar_tipos_gols(adicionar_coluna_segmentos(df)))
+
+    return tema.titulo(fig, f'Participações em Tipos de Gol - {jogador}')
+
+
+
+def figura_assistencias():
+    return grafico_barras_assistencias(*contar_assists_jogadores(adicionar_coluna_segmentos(df)))
+
+
+# -----------------------------------Início da Estrutura Lógica do Código ----------------------------------
+
 # =====================================
 # Barra Lateral
 # =====================================
@@ -874,13 +549,43 @@ df_vd['Data'] = pd.to_datetime(df_vd['Data'], format='%d-%m-%Y')
 
 st.sidebar.markdown('# Dashboard Futsal ')
 
-image2 = Image.open(r'images/logo.png')
-st.sidebar.image( image2, use_column_width=True)
+st.sidebar.image( recursos.logo_barra_lateral(), use_column_width=True)
 
 st.sidebar.markdown("""---""")
 
 # Filtro Temporada
-ano = st.sidebar.selectbox("Selecione a Temporada:", ("2023"))
+temporadas = listar_temporadas()
+ano = st.sidebar.selectbox("Selecione a Temporada:", temporadas, index=len(temporadas) - 1)
+
+
+# =====================================
+# Import dataset
+# =====================================
+
+
+# Apenas a partição da temporada selecionada é lida (compartilhada, somente leitura)
+df, df_vd = carregar_dados([ano])
+df_participacoes = carregar_participacoes([ano])
+df_acumulados = carregar_acumulados([ano])
+df_cubo = carregar_agregados([ano])['agregados_cubo']
+
+
+# =====================================
+# Limpeza do dataset
+# =====================================
+
+
+# Criando número de partidas
+players_matches2 = n_player_matches(df_participacoes)
+
+# Adicionar Local no df (consulta pelo identificador da partida, sem alterar o df compartilhado)
+df = df.assign(Local=df['Partida'].map(df_vd.set_index('Partida')['Local']))
+
+
+# =====================================
+# Barra Lateral - Filtros
+# =====================================
+
 
 # Filtro Data
 date_slider = st.sidebar.slider(
@@ -900,22 +605,30 @@ local = st.sidebar.multiselect("Selecione os Locais:",
 # Converter o valor do date_slider para datetime64[ns] antes de usar no filtro
 date_slider = pd.to_datetime(date_slider)
 
-# Filtrar por ano
-df = df[df['Ano'] == ano]
-df_vd = df_vd[df_vd['Ano'] == ano]
-
-#Filtrar por Local
-df = df[df['Local'].isin(local)]
-df_vd = df_vd[df_vd['Local'].isin(local)]
+# Totais dos jogadores com os filtros atuais lidos das tabelas pré-calculadas:
+#   - sem filtro de local: acumulados até a data do slider (busca binária, ver utils.acumulados)
+#   - com filtro de local e o slider na última rodada: soma das células do cubo (ver utils.cubo)
+# Nos demais casos (None) os totais são calculados a partir das linhas filtradas
+if set(local) == set(df_vd['Local'].unique()):
+    df_totais = acumulados.ate(df_acumulados, date_slider)
+elif date_slider >= df_vd['Data'].max():
+    df_totais = cubo.totais_jogadores(cubo.filtrar(df_cubo, locais=local))
+else:
+    df_totais = None
 
-#filtro de data
-df = df.loc[df['Data'] <= date_slider ,:]
-df_vd = df_vd.loc[df_vd['Data'] <= date_slider ,:]
+if usar_banco([ano]):
+    # Filtros executados como consultas indexadas no SQLite (utils.banco)
+    df, df_vd = banco.filtrar([ano], local, date_slider)
+else:
+    # Filtros de local e data como operações sobre os índices bitmap (utils.indices),
+    # aplicados com uma única seleção de linhas em cada tabela
+    indice = carregar_indices([ano])
+    df = df.take(indices.selecionar(indice['gols'], df['Data'], local, date_slider))
+    df_vd = df_vd.take(indices.selecionar(indice['resultados'], df_vd['Data'], local, date_slider))
 
-players_matches = n_player_matches(df_vd)
+# Participações das partidas filtradas
+df_participacoes = df_participacoes[df_participacoes['Partida'].isin(df_vd['Partida'])]
 
-# Atualize a tabela de pontos
-df_players_points = criar_tabela_pontos(df_vd)
 
 # =====================================
 # Layout Streamlit 
@@ -927,8 +640,13 @@ st.write ( f"# Análise Jogador Temporada {ano}" )
 # Criar um selectbox com os nomes dos jogadores
 jogador = st.selectbox("Selecione o Jogador:", sorted(players_matches2.keys()))
 
-# Criando Tabela de Pontos
-df_players_points = criar_tabela_pontos(df_vd)
+# Tabela de perfis de todos os jogadores (card e gráfico de participações)
+if df_totais is not None:
+    df_perfis = perfis.montar_agregados(df_totais)
+else:
+    # Com o SQLite, gols e assistências por jogador contados com os índices de goleador e assistente
+    df_gols = banco.contar_gols([ano], local, date_slider) if usar_banco([ano]) else None
+    df_perfis = perfis.montar(df, df_participacoes, df_gols)
 
 tab1, tab2, tab3 = st.tabs(['Visão Geral ', 'Análise Companheiros', 'Análise Gols e Assistências'])
 
@@ -939,44 +657,36 @@ with tab1:
 if df.empty:
     st.warning(f"Não há dados disponíveis para o jogador {jogador} na temporada {ano}.")
 else:
+    # Chave das figuras no cache: o gráfico, os filtros, o jogador e a versão dos dados.
+    # Com a mesma chave (em qualquer sessão) a agregação e a montagem são dispensadas.
+    filtros = (ano, tuple(sorted(local)), date_slider, jogador, versao_dados([ano]))
+
     with tab2:
         with st.container():
-            players_count = contar_companheiros(df_vd)
-            fig = grafico_companheiros_frequentes(players_count)
-            fig = apply_custom_styles(fig, titulo=f'Companheiros mais Frequentes de {jogador}')
-            st.plotly_chart(fig)
+            fig = figuras.obter(('Companheiros mais Frequentes',) + filtros, figura_companheiros_frequentes)
+            st.plotly_chart(fig, theme=None)
             
         with st.container():
-            jogadores, derrotas, empates, vitorias, aproveitamento, jogos = gerar_listas(df_vd)
-            fig = grafico_companheiros_aproveitamento()
-            fig = apply_custom_styles(fig, titulo=f'V/E/D + Aproveitamento por Comapanheiro de {jogador}')
-            st.plotly_chart(fig)
+            fig = figuras.obter(('Aproveitamento por Companheiro',) + filtros, figura_companheiros_aproveitamento)
+            st.plotly_chart(fig, theme=None)
     
     with tab3:
         with st.container():
-            fig = grafico_pie(df)
-            fig = apply_custom_styles(fig, titulo=f'Contagem de Tipos de Gol de {jogador}')
-            st.plotly_chart(fig)
+            fig = figuras.obter(('Gols e Assistências',) + filtros, figura_pie)
+            st.plotly_chart(fig, theme=None)
 
         # Verificar se todas as linhas da coluna 'Placar' estão vazias
         if df['Placar'].isna().all():
             st.warning('Os gols filtrados não possuem informações de características.')
         else:
             with st.container():
-                df = adicionar_coluna_segmentos(df)
-                df = adicionar_colunas_tipo_gol(df)
-                parcela_counts, parcela_counts_gols, parcela_counts_assists, pontos_mapping = contar_participacoes(df)
-                fig = grafico_barra_segmento_jogador()
-                fig = apply_custom_styles(fig, titulo=f'Participações de acordo com período de jogo - {jogador}')
-                st.plotly_chart(fig)
+                fig = figuras.obter(('Participações por Segmento',) + filtros, figura_segmento_jogador)
+                st.plotly_chart(fig, theme=None)
         
             with st.container():
-                pontos_mapping, parcela_counts, parcela_counts_gols, parcela_counts_assists = contar_tipos_gols()
-                fig = grafico_barra_tipo_gol_jogador()
-                fig = apply_custom_styles(fig, titulo=f'Participações em Tipos de Gol - {jogador}')
-                st.plotly_chart(fig)
+                fig = figuras.obter(('Participações por Tipo de Gol',) + filtros, figura_tipo_gol_jogador)
+                st.plotly_chart(fig, theme=None)
         
             with st.container():
-                assistente_counts_goleador, no_assistente_counts, assistente_counts_assistente = contar_assists_jogadores(df)
-                fig = grafico_barras_assistencias()
-                st.plotly_chart(fig)
+                fig = figuras.obter(('Distribuição das Assistências',) + filtros, figura_assistencias)
+                st.plotly_chart(fig, theme=None)
@@ -0,0 +1,120 @@
+'''
+    Contadores acumulados por data de rodada (somas de prefixo).
+
+    Para cada data de rodada da temporada, a tabela guarda uma linha por jogador
+    com os totais de Partidas, Vitorias, Derrotas, Empates, Gols e Assistencias
+    até aquela data (inclusive). As linhas ficam ordenadas por Data, então:
+        - a situação até qualquer data é uma busca binária seguida da leitura
+          de um bloco contíguo de linhas (ver ate)
+        - a diferença entre duas datas é uma subtração (ver entre)
+
+    É gravada na partição da temporada pela ingestão (utils.ingestao) e usada
+    pelo filtro de data das páginas sem refiltrar os gols e as partidas.
+'''
+import pandas as pd
+
+from utils import jogadores
+from utils.classificacao import COLUNAS_RESULTADOS
+
+
+# Contadores acumulados, na ordem das colunas
+COLUNAS = ['Partidas', 'Vitorias', 'Derrotas', 'Empates', 'Gols', 'Assistencias']
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def contar_por_data(df, df_participacoes):
+    '''
+        Retorna um DataFrame indexado por (Data, Jogador) com as contagens
+        (COLUNAS) de cada jogador em cada data, sem acumular
+    '''
+    df_resultados = df_participacoes.groupby(['Data', 'Jogador', 'Resultado'], observed=True).size().unstack(fill_value=0)
+    df_resultados = df_resultados.reindex(columns=list(COLUNAS_RESULTADOS), fill_value=0).rename(columns=COLUNAS_RESULTADOS)
+    df_resultados.columns.name = None
+    df_resultados.insert(0, 'Partidas', df_resultados.sum(axis=1))
+
+    # Gols e assistências ("-" indica gol sem assistência)
+    gols = df.groupby(['Data', 'Goleador'], observed=True).size().rename('Gols')
+    assistencias = df[df['Assistente'] != '-'].groupby(['Data', 'Assistente'], observed=True).size().rename('Assistencias')
+    gols.index.names = assistencias.index.names = ['Data', 'Jogador']
+
+    df_contagem = pd.concat([df_resultados, gols, assistencias], axis=1).fillna(0).astype('int32')
+
+    return df_contagem[COLUNAS]
+
+
+
+def acumular_contagens(df_contagem):
+    '''
+        Converte as contagens por (Data, Jogador) (ver contar_por_data) na tabela
+        de acumulados: todas as datas x todos os jogadores, ordenada por Data
+    '''
+    datas = df_contagem.index.get_level_values('Data').unique().sort_values()
+    nomes = df_contagem.index.get_level_values('Jogador').unique()
+
+    # Grade densa datas x jogadores x contadores e soma de prefixo ao longo das datas
+    grade = pd.MultiIndex.from_product([datas, nomes], names=['Data', 'Jogador'])
+    valores = df_contagem.reindex(grade, fill_value=0).to_numpy()
+    valores = valores.reshape(len(datas), len(nomes), len(COLUNAS)).cumsum(axis=0, dtype='int32')
+
+    df_acumulados = pd.DataFrame(valores.reshape(-1, len(COLUNAS)), index=grade, columns=COLUNAS)
+
+    return df_acumulados.reset_index()
+
+
+
+def acumular(df, df_participacoes):
+    '''
+        Retorna a tabela de acumulados (Data, Jogador e COLUNAS) da temporada a
+        partir dos gols (df) e das participações
+    '''
+    return acumular_contagens(contar_por_data(df, df_participacoes))
+
+
+
+def encadear(tabelas):
+    '''
+        Combina as tabelas de acumulados de várias temporadas (em ordem
+        cronológica) em uma só, com os totais acumulados desde a primeira
+    '''
+    contagens = []
+    for df_acumulados in tabelas:
+        # Volta às contagens de cada data: diferença entre datas consecutivas
+        df_contagem = df_acumulados.set_index(['Data', 'Jogador'])[COLUNAS]
+        anteriores = df_contagem.groupby(level='Jogador', observed=True).shift(1, fill_value=0)
+        contagens.append((df_contagem - anteriores).reset_index())
+
+    df_contagem = jogadores.concatenar(contagens).set_index(['Data', 'Jogador'])
+
+    return acumular_contagens(df_contagem)
+
+
+
+def ate(df_acumulados, data):
+    '''
+        Retorna os acumulados de cada jogador até a data informada (inclusive):
+        o bloco de linhas da última data de rodada não posterior a ela
+    '''
+    datas = df_acumulados['Data']
+    fim = datas.searchsorted(pd.Timestamp(data), side='right')
+    if fim == 0:
+        return df_acumulados.iloc[:0]
+
+    inicio = datas.searchsorted(datas.iloc[fim - 1], side='left')
+
+    return df_acumulados.iloc[inicio:fim]
+
+
+
+def entre(df_acumulados, data_inicio, data_fim):
+    '''
+        Retorna um DataFrame indexado por Jogador com as contagens (COLUNAS) das
+        rodadas depois de data_inicio e até data_fim (inclusive)
+    '''
+    fim = ate(df_acumulados, data_fim).set_index('Jogador')[COLUNAS]
+    inicio = ate(df_acumulados, data_inicio).set_index('Jogador')[COLUNAS]
+
+    return fim.sub(inicio, fill_value=0).astype('int32')
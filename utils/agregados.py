@@ -0,0 +1,141 @@
+'''
+    Agregados aditivos da temporada (classificação, goleadores/assistentes,
+    classificação mensal, locais, meses e o cubo temporada x mês x local x
+    jogador x resultado, ver utils.cubo).
+
+    Todos os agregados são contagens, então os agregados de uma rodada nova
+    podem ser somados aos já gravados (ver somar_agregados) sem reprocessar a
+    temporada inteira.
+'''
+import pandas as pd
+
+from utils import cubo, jogadores
+
+
+# Resultado da participação (ver utils.ingestao.compilar_participacoes) -> coluna agregada
+COLUNAS_RESULTADOS = {
+    'Vitoria': 'Vitorias',
+    'Empate': 'Empates',
+    'Derrota': 'Derrotas'
+}
+
+# Tabela agregada -> coluna(s) chave
+CHAVES = {
+    'agregados_jogadores': 'Jogador',
+    'agregados_jogadores_meses': ['Ano', 'Mes', 'Jogador'],
+    'agregados_locais': 'Local',
+    'agregados_meses': 'Mes',
+    'agregados_cubo': cubo.DIMENSOES
+}
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def contar_jogadores(df, df_participacoes, chaves=()):
+    '''
+        Retorna um DataFrame com uma linha por jogador (dentro de cada grupo das
+        colunas chaves, presentes nos gols e nas participações) e as colunas:
+            - Partidas, Vitorias, Empates, Derrotas
+            - Gols, Assistencias
+    '''
+    chaves = list(chaves)
+
+    # Um registro (jogador, resultado) para cada jogador de cada time
+    df_agregado = df_participacoes.groupby(chaves + ['Jogador', 'Resultado'], observed=True).size().unstack(fill_value=0)
+    df_agregado = df_agregado.reindex(columns=list(COLUNAS_RESULTADOS), fill_value=0).rename(columns=COLUNAS_RESULTADOS)
+    df_agregado.columns.name = None
+    df_agregado.insert(0, 'Partidas', df_agregado.sum(axis=1))
+
+    # Gols e assistências ("-" indica gol sem assistência).
+    # Agrupamentos de categóricas com observed=True: só as combinações com ocorrência
+    gols = df.groupby(chaves + ['Goleador'], observed=True).size().rename('Gols')
+    assistencias = df[df['Assistente'] != '-'].groupby(chaves + ['Assistente'], observed=True).size().rename('Assistencias')
+    gols.index.names = assistencias.index.names = chaves + ['Jogador']
+
+    df_agregado = pd.concat([df_agregado, gols, assistencias], axis=1).fillna(0).astype(int)
+
+    return df_agregado.reset_index()
+
+
+
+def agregar_jogadores(df, df_participacoes):
+    '''
+        Retorna um DataFrame com uma linha por jogador na temporada (ver contar_jogadores)
+    '''
+    return contar_jogadores(df, df_participacoes)
+
+
+
+def agregar_jogadores_meses(df, df_participacoes):
+    '''
+        Retorna um DataFrame com uma linha por (temporada, mês, jogador) (ver
+        contar_jogadores): a classificação mensal é um recorte desta tabela
+    '''
+    return contar_jogadores(df, df_participacoes, ['Ano', 'Mes'])
+
+
+
+def agregar_locais(df, df_vd):
+    '''
+        Retorna um DataFrame com uma linha por local e as colunas N Partidas e Total Gols
+    '''
+    partidas = df_vd['Local'].value_counts().rename('N Partidas')
+
+    # Local de cada gol pelo identificador da partida
+    local_gols = df['Partida'].map(df_vd.set_index('Partida')['Local'])
+    gols = local_gols.value_counts().rename('Total Gols')
+
+    # Colunas categóricas também contam as categorias sem ocorrência: descarta os zeros
+    partidas, gols = partidas[partidas > 0], gols[gols > 0]
+
+    df_agregado = pd.concat([partidas, gols], axis=1).fillna(0).astype(int)
+    df_agregado.index.name = 'Local'
+
+    return df_agregado.reset_index()
+
+
+
+def agregar_meses(df, df_vd):
+    '''
+        Retorna um DataFrame com uma linha por mês e as colunas N Jogos e N Gols
+    '''
+    jogos = df_vd.groupby('Mes', observed=True)['Partida'].nunique().rename('N Jogos')
+    gols = df.groupby('Mes', observed=True).size().rename('N Gols')
+
+    df_agregado = pd.concat([jogos, gols], axis=1).fillna(0).astype(int)
+    df_agregado.index.name = 'Mes'
+
+    return df_agregado.reset_index()
+
+
+
+def agregar(df, df_vd, df_participacoes):
+    '''
+        Retorna o dicionário com todas as tabelas agregadas dos DataFrames de
+        gols (df), de resultados (df_vd) e de participações (df_participacoes)
+    '''
+    return {
+        'agregados_jogadores': agregar_jogadores(df, df_participacoes),
+        'agregados_jogadores_meses': agregar_jogadores_meses(df, df_participacoes),
+        'agregados_locais': agregar_locais(df, df_vd),
+        'agregados_meses': agregar_meses(df, df_vd),
+        'agregados_cubo': cubo.montar(df, df_vd, df_participacoes)
+    }
+
+
+
+def somar_agregados(agregados, novos):
+    '''
+        Soma, chave a chave, duas coleções de tabelas agregadas (ver agregar).
+        Usada para acrescentar as rodadas novas aos agregados já gravados e para
+        combinar várias temporadas.
+    '''
+    soma = {}
+    for tabela, chave in CHAVES.items():
+        df_soma = jogadores.concatenar([agregados[tabela], novos[tabela]])
+        soma[tabela] = df_soma.groupby(chave, sort=False, observed=True).sum().reset_index()
+
+    return soma
@@ -0,0 +1,80 @@
+'''
+    Matriz de assistências (goleador x assistente).
+
+    Conta, para cada par (goleador, assistente), quantos gols saíram dessa
+    combinação, com a coluna "-" para os gols sem assistência. A matriz é
+    calculada uma única vez para os gols filtrados: as assistências recebidas
+    por um jogador são a sua linha, as concedidas são a sua coluna e os gols
+    sem assistência são a célula da coluna "-". Métricas da rede de
+    assistências do elenco todo também podem ser lidas da matriz, sem
+    percorrer os gols de novo.
+'''
+import pandas as pd
+
+from utils.jogadores import SEM_ASSISTENCIA
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def matriz_assistencias(df):
+    '''
+        Retorna o DataFrame goleadores x assistentes com o número de gols de cada
+        par. As linhas e as colunas têm os mesmos jogadores (todos os goleadores
+        e assistentes dos gols); a última coluna ("-") conta os gols sem assistência.
+    '''
+    contagem = df.groupby(['Goleador', 'Assistente'], observed=True).size()
+
+    goleadores = contagem.index.get_level_values('Goleador').unique().astype(object)
+    assistentes = contagem.index.get_level_values('Assistente').unique().astype(object)
+    nomes = goleadores.union(assistentes).drop(SEM_ASSISTENCIA, errors='ignore')
+
+    matriz = contagem.unstack(fill_value=0)
+    matriz.index = matriz.index.astype(object)
+    matriz.columns = matriz.columns.astype(object)
+
+    return matriz.reindex(index=nomes, columns=nomes.append(pd.Index([SEM_ASSISTENCIA])), fill_value=0)
+
+
+
+def ordenar_contagem(contagem):
+    '''
+        Descarta as contagens zeradas e ordena da maior para a menor (ordenação estável)
+    '''
+    return contagem[contagem > 0].sort_values(ascending=False, kind='stable')
+
+
+
+def recebidas(matriz, jogador):
+    '''
+        Retorna a Series assistente -> número de assistências para gols do jogador
+    '''
+    if jogador not in matriz.index:
+        return pd.Series(dtype='int64')
+
+    return ordenar_contagem(matriz.loc[jogador].drop(SEM_ASSISTENCIA))
+
+
+
+def concedidas(matriz, jogador):
+    '''
+        Retorna a Series goleador -> número de assistências do jogador para os seus gols
+    '''
+    if jogador not in matriz.columns:
+        return pd.Series(dtype='int64')
+
+    return ordenar_contagem(matriz[jogador])
+
+
+
+def sem_assistencia(matriz, jogador):
+    '''
+        Retorna a Series {jogador: número de gols do jogador sem assistência}
+        (vazia quando não há nenhum)
+    '''
+    if jogador not in matriz.index:
+        return pd.Series(dtype='int64')
+
+    return ordenar_contagem(matriz.loc[[jogador], SEM_ASSISTENCIA])
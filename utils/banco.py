@@ -0,0 +1,258 @@
+'''
+    Backend opcional em SQLite para as consultas do dashboard.
+
+    O banco guarda os gols e as partidas de todas as temporadas, com índices em
+    data, local, goleador e assistente, para que os filtros e as contagens por
+    local e por jogador sejam consultas indexadas em vez de varreduras
+    completas dos DataFrames. É preenchido pela ingestão, no diretório do armazenamento
+    compilado:
+
+        python -m utils.ingestao --sqlite
+
+    Cada temporada gravada registra o hash do manifesto da partição de origem
+    (tabela versoes). As páginas usam o banco quando a variável de ambiente
+    FUTSAL_BACKEND=sqlite está definida, o banco existe e foi gravado a partir
+    das partições atuais (ver utils.dados.usar_banco); caso contrário, todas
+    as tabelas vêm das partições.
+'''
+import os
+import sqlite3
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+from utils.jogadores import SEM_ASSISTENCIA
+
+
+ARQUIVO_BANCO = 'futsal.sqlite'
+CAMINHO_BANCO = os.path.join('dataset/compilado', ARQUIVO_BANCO)
+
+# Incrementar sempre que o esquema das tabelas mudar (as tabelas antigas são recriadas)
+VERSAO_BANCO = 7
+
+COLUNAS_GOLS = ['Ano', 'Partida', 'Data', 'Mes', 'Local', 'Goleador', 'Assistente', 'Minuto', 'Placar', 'Time A', 'Time B', 'Tipo de Gol']
+COLUNAS_PARTIDAS = ['Ano', 'Partida', 'Data', 'Mes', 'Local', 'Time Vencedor', 'Time Perdedor', 'Time Empate 1', 'Time Empate 2']
+
+ESQUEMA = '''
+CREATE TABLE IF NOT EXISTS gols (
+    Ano TEXT, Partida INTEGER, Data TEXT, Mes TEXT, Local TEXT,
+    Goleador TEXT, Assistente TEXT, Minuto REAL, Placar TEXT,
+    "Time A" INTEGER, "Time B" INTEGER, "Tipo de Gol" TEXT
+);
+CREATE TABLE IF NOT EXISTS partidas (
+    Ano TEXT, Partida INTEGER, Data TEXT, Mes TEXT, Local TEXT,
+    "Time Vencedor" TEXT, "Time Perdedor" TEXT, "Time Empate 1" TEXT, "Time Empate 2" TEXT
+);
+CREATE TABLE IF NOT EXISTS versoes (
+    Ano TEXT PRIMARY KEY, Manifesto TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_gols_data ON gols (Ano, Data);
+CREATE INDEX IF NOT EXISTS idx_gols_local ON gols (Local, Data);
+CREATE INDEX IF NOT EXISTS idx_gols_goleador ON gols (Goleador, Data);
+CREATE INDEX IF NOT EXISTS idx_gols_assistente ON gols (Assistente, Data);
+CREATE INDEX IF NOT EXISTS idx_partidas_data ON partidas (Ano, Data);
+CREATE INDEX IF NOT EXISTS idx_partidas_local ON partidas (Local, Data);
+'''
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def ativo(caminho=CAMINHO_BANCO):
+    '''
+        Indica se as páginas devem usar o backend SQLite
+    '''
+    return os.environ.get('FUTSAL_BACKEND', '').lower() == 'sqlite' and os.path.exists(caminho)
+
+
+
+def conectar(caminho=CAMINHO_BANCO):
+    '''
+        Abre uma conexão somente leitura com o banco.
+        Cada consulta abre a sua conexão, o que é seguro entre as threads das
+        sessões do Streamlit e entre processos.
+    '''
+    return sqlite3.connect(f'file:{caminho}?mode=ro', uri=True)
+
+
+
+def versoes(caminho=CAMINHO_BANCO):
+    '''
+        Retorna o dicionário {ano: hash do manifesto da partição} das temporadas
+        gravadas no banco (vazio para bancos sem a tabela versoes)
+    '''
+    with closing(conectar(caminho)) as conexao:
+        try:
+            return dict(conexao.execute('SELECT Ano, Manifesto FROM versoes').fetchall())
+        except sqlite3.OperationalError:
+            return {}
+
+
+
+def gravar_temporada(ano, df, df_vd, manifesto, caminho=CAMINHO_BANCO):
+    '''
+        Substitui os gols e as partidas da temporada no banco e registra o hash
+        do manifesto da partição de origem (ver utils.ingestao.assinatura_manifesto)
+    '''
+    # Local de cada gol pelo identificador da partida
+    df = df.assign(Local=df['Partida'].map(df_vd.set_index('Partida')['Local']))
+
+    gols = df[COLUNAS_GOLS].copy()
+    partidas = df_vd[COLUNAS_PARTIDAS].copy()
+    gols['Data'] = gols['Data'].dt.strftime('%Y-%m-%d')
+    partidas['Data'] = partidas['Data'].dt.strftime('%Y-%m-%d')
+
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with closing(sqlite3.connect(caminho)) as conexao, conexao:
+        if conexao.execute('PRAGMA user_version').fetchone()[0] != VERSAO_BANCO:
+            conexao.executescript('DROP TABLE IF EXISTS gols; DROP TABLE IF EXISTS partidas; DROP TABLE IF EXISTS versoes; '
+                                  f'PRAGMA user_version = {VERSAO_BANCO};')
+        conexao.executescript(ESQUEMA)
+        conexao.execute('DELETE FROM gols WHERE Ano = ?', (ano,))
+        conexao.execute('DELETE FROM partidas WHERE Ano = ?', (ano,))
+        gols.to_sql('gols', conexao, if_exists='append', index=False)
+        partidas.to_sql('partidas', conexao, if_exists='append', index=False)
+        conexao.execute('INSERT OR REPLACE INTO versoes VALUES (?, ?)', (ano, manifesto))
+        conexao.execute('ANALYZE')
+
+
+
+def _filtros(anos, locais=None, data_max=None, mes=None):
+    '''
+        Monta a cláusula WHERE comum às consultas e os seus parâmetros
+    '''
+    condicoes = [f"Ano IN ({', '.join('?' * len(anos))})"]
+    parametros = list(anos)
+
+    if locais is not None:
+        condicoes.append(f"Local IN ({', '.join('?' * len(locais))})")
+        parametros += list(locais)
+
+    if data_max is not None:
+        condicoes.append('Data <= ?')
+        parametros.append(pd.Timestamp(data_max).strftime('%Y-%m-%d'))
+
+    if mes is not None:
+        condicoes.append('Mes = ?')
+        parametros.append(mes)
+
+    return ' AND '.join(condicoes), parametros
+
+
+
+def filtrar(anos, locais=None, data_max=None, mes=None):
+    '''
+        Retorna os DataFrames de gols (df, já com Local) e de resultados (df_vd)
+        das temporadas, locais, data limite e mês informados.
+        As linhas voltam na ordem em que foram gravadas (ordem dos gols na partida).
+    '''
+    where, parametros = _filtros(anos, locais, data_max, mes)
+
+    with closing(conectar()) as conexao:
+        df = pd.read_sql_query(f'SELECT * FROM gols WHERE {where} ORDER BY Ano, rowid',
+                               conexao, params=parametros, parse_dates=['Data'])
+        df_vd = pd.read_sql_query(f'SELECT * FROM partidas WHERE {where} ORDER BY Ano, rowid',
+                                  conexao, params=parametros, parse_dates=['Data'])
+
+    # O SQLite devolve textos ausentes como None; as páginas esperam NaN, como no Excel
+    # (where mantém as colunas como object, sem o aviso de conversão do fillna)
+    for tabela in (df, df_vd):
+        colunas_texto = tabela.select_dtypes('object').columns
+        tabela[colunas_texto] = tabela[colunas_texto].where(tabela[colunas_texto].notna(), np.nan)
+
+    return df, df_vd
+
+
+
+def contar_por_local(anos, locais=None, data_max=None):
+    '''
+        Retorna um DataFrame com Local, Total Gols e N Partidas
+    '''
+    where, parametros = _filtros(anos, locais, data_max)
+    consulta = f'''
+        SELECT p.Local, COALESCE(g.Total, 0) AS "Total Gols", p.Partidas AS "N Partidas"
+        FROM (SELECT Local, COUNT(*) AS Partidas FROM partidas WHERE {where} GROUP BY Local) AS p
+        LEFT JOIN (SELECT Local, COUNT(*) AS Total FROM gols WHERE {where} GROUP BY Local) AS g
+            ON g.Local = p.Local
+        ORDER BY p.Local
+    '''
+
+    with closing(conectar()) as conexao:
+        return pd.read_sql_query(consulta, conexao, params=parametros * 2)
+
+
+
+# =====================================
+# Contagens por jogador (índices de goleador e assistente)
+# =====================================
+
+
+def contar_gols(anos, locais=None, data_max=None):
+    '''
+        Retorna um DataFrame indexado por Jogador com as colunas Gols e
+        Assistencias (mesmo formato de utils.perfis.contar_gols)
+    '''
+    where, parametros = _filtros(anos, locais, data_max)
+    consulta = f'''
+        SELECT Jogador, SUM(Gols) AS Gols, SUM(Assistencias) AS Assistencias
+        FROM (
+            SELECT Goleador AS Jogador, COUNT(*) AS Gols, 0 AS Assistencias
+            FROM gols WHERE {where} GROUP BY Goleador
+            UNION ALL
+            SELECT Assistente, 0, COUNT(*)
+            FROM gols WHERE {where} AND Assistente != ? GROUP BY Assistente
+        )
+        GROUP BY Jogador
+    '''
+
+    with closing(conectar()) as conexao:
+        df_gols = pd.read_sql_query(consulta, conexao, params=parametros + parametros + [SEM_ASSISTENCIA])
+
+    return df_gols.set_index('Jogador')
+
+
+
+def _contar_jogador(anos, jogador, categoria, condicao, locais=None, data_max=None):
+    '''
+        Retorna as Series de participações, gols e assistências do jogador por
+        categoria (expressão SQL), sem as categorias zeradas e em ordem
+        decrescente, como value_counts
+    '''
+    where, parametros = _filtros(anos, locais, data_max)
+    consulta = f'''
+        SELECT {categoria} AS Categoria, COUNT(*) AS Participacoes,
+               SUM(Goleador = ?) AS Gols, SUM(Assistente = ?) AS Assistencias
+        FROM gols
+        WHERE {where} AND {condicao} AND (Goleador = ? OR Assistente = ?)
+        GROUP BY Categoria
+    '''
+
+    with closing(conectar()) as conexao:
+        contagens = pd.read_sql_query(consulta, conexao, params=[jogador, jogador] + parametros + [jogador, jogador])
+    contagens = contagens.set_index('Categoria')
+
+    return tuple(contagens.loc[contagens[coluna] > 0, coluna].sort_values(ascending=False, kind='stable')
+                 for coluna in ('Participacoes', 'Gols', 'Assistencias'))
+
+
+
+def segmentos_jogador(anos, jogador, locais=None, data_max=None):
+    '''
+        Participações, gols e assistências do jogador por segmento do jogo
+        (Inicio, Meio e Fim: a partir dos minutos 0, 20 e 40) nos gols com placar
+    '''
+    segmento = "CASE WHEN Minuto < 20 THEN 'Inicio' WHEN Minuto < 40 THEN 'Meio' ELSE 'Fim' END"
+
+    return _contar_jogador(anos, jogador, segmento, 'Placar IS NOT NULL AND Minuto IS NOT NULL', locais, data_max)
+
+
+
+def tipos_gol_jogador(anos, jogador, locais=None, data_max=None):
+    '''
+        Participações, gols e assistências do jogador por Tipo de Gol nos gols com placar
+    '''
+    return _contar_jogador(anos, jogador, '"Tipo de Gol"', 'Placar IS NOT NULL AND "Tipo de Gol" IS NOT NULL',
+                           locais, data_max)
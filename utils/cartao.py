@@ -0,0 +1,254 @@
+'''
+    Card do jogador (imagem com os números do perfil, ver utils.perfis).
+
+    A imagem de fundo e as fontes vêm do registro de recursos (utils.recursos),
+    carregadas uma vez por processo. O card pronto é codificado em PNG e
+    identificado pelo jogador e pelos valores exibidos (ver chave): o mesmo
+    card não é desenhado de novo enquanto os números não mudarem. As páginas
+    guardam os cards em memória (LRU, ver pages/3_🏃_Jogador.py) e, com a
+    variável de ambiente FUTSAL_CARTOES=disco, também no diretório de cards da
+    temporada:
+
+        dataset/compilado/cartoes/Ano=<ano>/<assinatura da partição>/<chave>.png
+
+    A assinatura é o hash do manifesto da partição (ver utils.ingestao), então
+    uma nova ingestão da temporada começa um diretório novo. Os cards de todos
+    os jogadores com os filtros padrão da página (todos os locais, até a última
+    rodada) podem ser gerados antes do primeiro acesso, em paralelo:
+
+        python -m utils.cartao                       # todas as temporadas
+        python -m utils.cartao --temporada 2023      # apenas uma temporada
+        python -m utils.cartao --processos 4         # número de processos
+
+    O PNG (compactado com optimize) é servido pelo st.image sem recodificar a
+    imagem quando informado output_format='PNG'; imagens WebP seriam
+    convertidas para JPEG pelo st.image a cada card novo.
+'''
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import ImageDraw
+
+from utils import acumulados, ingestao, perfis, recursos
+from utils.perfis import COLUNAS
+
+
+# Subdiretório do armazenamento compilado com os cards gravados
+DIR_CARTOES = 'cartoes'
+
+# Incrementar sempre que o desenho do card mudar (os cards gravados são descartados)
+VERSAO_CARTAO = 2
+
+# Campos do card: coluna do perfil (None: nome do jogador), cor, tamanho da
+# fonte, itálico, alinhamento e posição
+CAMPOS = [
+    (None,            '#161620', 70,  True,  'left',   (100, 65)),
+    ('Partidas',      '#FFFFFF', 100, True,  'center', (108, 222)),
+    ('Pontos',        '#C5D92A', 95,  True,  'center', (230, 385)),
+    ('Vitorias',      '#00B050', 70,  False, 'center', (115, 555)),
+    ('Empates',       '#FFC000', 70,  False, 'center', (228, 555)),
+    ('Derrotas',      '#C00000', 70,  False, 'center', (341, 555)),
+    ('Participacoes', '#FFFFFF', 85,  True,  'center', (963, 120)),
+    ('Gols',          '#ED7D31', 35,  False, 'center', (536, 460)),
+    ('Assistencias',  '#38DBCC', 35,  False, 'center', (1182, 330))
+]
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def hex_para_rgb(cor):
+    cor = cor.lstrip('#')
+    return tuple(int(cor[i:i+2], 16) for i in (0, 2, 4))
+
+
+
+def valores(linha):
+    '''
+        Retorna a tupla com os valores do perfil exibidos no card (ver
+        utils.perfis.perfil), na ordem de utils.perfis.COLUNAS
+    '''
+    return tuple(int(linha[coluna]) for coluna in COLUNAS)
+
+
+
+def chave(jogador, numeros):
+    '''
+        Identificador do card: hash do jogador, dos valores exibidos e da versão do desenho
+    '''
+    conteudo = json.dumps([VERSAO_CARTAO, jogador, list(numeros)])
+
+    return hashlib.sha1(conteudo.encode('utf-8')).hexdigest()
+
+
+
+def desenhar(jogador, numeros):
+    '''
+        Desenha o card do jogador com os valores informados (ver valores) e
+        retorna a imagem
+    '''
+    img = recursos.imagem(recursos.CAMINHO_JOGADOR).copy()
+    d = ImageDraw.Draw(img)
+    textos = dict(zip(COLUNAS, numeros))
+
+    for coluna, cor, tamanho, italico, alinhamento, (x, y) in CAMPOS:
+        texto = jogador.upper() if coluna is None else str(textos[coluna])
+        font = recursos.fonte(recursos.FONTE_ITALICA if italico else recursos.FONTE_NEGRITO, tamanho)
+
+        # Largura do texto para ajustar o alinhamento
+        text_bbox = d.textbbox((0, 0), texto, font=font)
+        text_width = text_bbox[2] - text_bbox[0]
+
+        if alinhamento == 'center':
+            x -= text_width // 2
+        elif alinhamento == 'right':
+            x -= text_width
+
+        d.text((x, y), texto, font=font, fill=hex_para_rgb(cor))
+
+    return img
+
+
+
+def codificar(img):
+    '''
+        Codifica o card em PNG compactado (sem perdas)
+    '''
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG', optimize=True)
+
+    return buffer.getvalue()
+
+
+
+def disco_ativo():
+    '''
+        Indica se os cards devem ser gravados/lidos no diretório da temporada
+    '''
+    return os.environ.get('FUTSAL_CARTOES', '').lower() == 'disco'
+
+
+
+def diretorio_temporada(ano, diretorio=ingestao.DIR_COMPILADO):
+    '''
+        Diretório dos cards da temporada na versão atual da partição (None se a
+        partição não existe)
+    '''
+    assinatura = ingestao.assinatura_manifesto(ano, diretorio)
+    if assinatura is None:
+        return None
+
+    return os.path.join(diretorio, DIR_CARTOES, f'Ano={ano}', assinatura)
+
+
+
+def gravar(caminho, conteudo):
+    '''
+        Grava o card no disco de forma atômica (arquivo temporário + os.replace)
+    '''
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = f'{caminho}.{os.getpid()}.tmp'
+    with open(temporario, 'wb') as arquivo:
+        arquivo.write(conteudo)
+    os.replace(temporario, caminho)
+
+
+
+def renderizar(jogador, numeros, diretorio=None):
+    '''
+        Retorna o card do jogador em PNG (bytes). Com diretorio (ver
+        diretorio_temporada), reaproveita o card gravado com a mesma chave ou
+        grava o card desenhado.
+    '''
+    caminho = os.path.join(diretorio, f'{chave(jogador, numeros)}.png') if diretorio else None
+    if caminho and os.path.exists(caminho):
+        with open(caminho, 'rb') as arquivo:
+            return arquivo.read()
+
+    conteudo = codificar(desenhar(jogador, numeros))
+    if caminho:
+        gravar(caminho, conteudo)
+
+    return conteudo
+
+
+
+# =====================================
+# Geração antecipada dos cards
+# =====================================
+
+
+def cartoes_padrao(tabelas):
+    '''
+        Retorna a lista [(jogador, valores)] dos cards de todos os jogadores da
+        temporada com os filtros padrão da página (todos os locais, até a última rodada)
+    '''
+    df_totais = acumulados.ate(tabelas['acumulados'], tabelas['resultados']['Data'].max())
+    df_perfis = perfis.montar_agregados(df_totais)
+
+    nomes = tabelas['participacoes']['Jogador'].astype(object).unique()
+
+    return [(jogador, valores(perfis.perfil(df_perfis, jogador))) for jogador in nomes]
+
+
+
+def _renderizar_tarefa(tarefa):
+    '''
+        Executada nos processos do pool: renderiza um card (jogador, valores, diretorio)
+    '''
+    jogador, numeros, destino = tarefa
+    renderizar(jogador, numeros, destino)
+
+
+
+def pre_renderizar(ano, processos=None, diretorio=ingestao.DIR_COMPILADO):
+    '''
+        Gera os cards padrão da temporada no seu diretório (ver diretorio_temporada)
+        com um pool de processos e remove os diretórios de versões anteriores
+        da partição. Retorna o número de cards e o diretório.
+    '''
+    destino = diretorio_temporada(ano, diretorio)
+    tarefas = [(jogador, numeros, destino) for jogador, numeros in cartoes_padrao(ingestao.ler_particao(ano, diretorio))]
+
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        list(pool.map(_renderizar_tarefa, tarefas, chunksize=8))
+
+    # Cards de versões anteriores da partição não são mais lidos
+    pasta_temporada = os.path.dirname(destino)
+    for versao in os.listdir(pasta_temporada):
+        if os.path.join(pasta_temporada, versao) != destino:
+            shutil.rmtree(os.path.join(pasta_temporada, versao), ignore_errors=True)
+
+    return len(tarefas), destino
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Gera os cards dos jogadores de cada temporada.')
+    parser.add_argument('--destino', default=ingestao.DIR_COMPILADO, help='Diretório do armazenamento compilado')
+    parser.add_argument('--temporada', action='append', help='Temporada a gerar (pode ser repetido)')
+    parser.add_argument('--processos', type=int, default=None, help='Número de processos (padrão: um por núcleo)')
+    args = parser.parse_args()
+
+    temporadas = ingestao.listar_particoes(args.destino)
+    if args.temporada:
+        temporadas = [ano for ano in temporadas if ano in args.temporada]
+
+    for ano in temporadas:
+        if not ingestao.particao_atualizada(ano, ingestao.descobrir_temporadas().get(ano), args.destino):
+            print(f'{ano}: partição desatualizada, execute python -m utils.ingestao antes')
+            continue
+
+        n_cartoes, destino = pre_renderizar(ano, args.processos, args.destino)
+        print(f'{ano}: {n_cartoes} cards -> {destino}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+'''
+    Tabela de classificação (pontos) dos jogadores.
+
+    Calcula partidas, vitórias, empates, derrotas, pontos e aproveitamento de
+    qualquer conjunto de partidas em uma única passada vetorizada sobre a tabela
+    de participações (uma linha por jogador em cada partida, ver
+    utils.ingestao.compilar_participacoes) ou a partir dos agregados da
+    temporada (ver utils.agregados).
+
+    As colunas são numéricas: o Aproveitamento é um percentual (0 a 100) e só é
+    formatado na exibição (ver FORMATO_APROVEITAMENTO).
+'''
+
+PONTOS_VITORIA = 3
+PONTOS_EMPATE = 1
+
+# Resultado da participação -> coluna da classificação
+COLUNAS_RESULTADOS = {
+    'Vitoria': 'Vitorias',
+    'Derrota': 'Derrotas',
+    'Empate': 'Empates'
+}
+
+# Colunas da tabela de classificação, na ordem de exibição
+COLUNAS = ['Posicao', 'Jogador', 'Partidas', 'Vitorias', 'Derrotas', 'Empates', 'Pontos', 'Aproveitamento']
+
+# Formatação do Aproveitamento na exibição (ex.: Styler.format)
+FORMATO_APROVEITAMENTO = '{:.2f}%'
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def contar_resultados(df_participacoes):
+    '''
+        Retorna um DataFrame indexado por Jogador com as colunas Partidas,
+        Vitorias, Derrotas e Empates de cada jogador nas participações informadas
+    '''
+    df_resultados = df_participacoes.groupby(['Jogador', 'Resultado'], observed=True).size().unstack(fill_value=0)
+    df_resultados = df_resultados.reindex(columns=list(COLUNAS_RESULTADOS), fill_value=0)
+    df_resultados = df_resultados.rename(columns=COLUNAS_RESULTADOS)
+    df_resultados.columns.name = None
+
+    df_resultados.insert(0, 'Partidas', df_resultados.sum(axis=1))
+
+    return df_resultados
+
+
+
+def calcular_pontos(df_resultados):
+    '''
+        Adiciona as colunas Pontos e Aproveitamento (percentual, 0 a 100) ao
+        DataFrame com Partidas, Vitorias e Empates
+    '''
+    df_resultados['Pontos'] = df_resultados['Vitorias'] * PONTOS_VITORIA + df_resultados['Empates'] * PONTOS_EMPATE
+    df_resultados['Aproveitamento'] = df_resultados['Pontos'] / (df_resultados['Partidas'] * PONTOS_VITORIA) * 100
+
+    return df_resultados
+
+
+
+def ordenar(df_resultados):
+    '''
+        Ordena a classificação por Pontos (ordenação estável) e cria a coluna Posicao
+    '''
+    df_pontos = df_resultados.sort_values(by='Pontos', ascending=False, kind='stable').reset_index()
+    df_pontos.insert(0, 'Posicao', range(1, len(df_pontos) + 1))
+
+    return df_pontos[COLUNAS]
+
+
+
+def tabela_pontos(df_participacoes):
+    '''
+        Retorna a tabela de classificação (ver COLUNAS) das participações
+        informadas, que podem estar filtradas por mês, local, data, etc.
+    '''
+    return ordenar(calcular_pontos(contar_resultados(df_participacoes)))
+
+
+
+def tabela_pontos_agregados(df_agregados):
+    '''
+        Retorna a tabela de classificação (ver COLUNAS) a partir dos agregados
+        de jogadores (ver utils.agregados), sem reprocessar as partidas
+    '''
+    df_resultados = df_agregados.loc[df_agregados['Partidas'] > 0].set_index('Jogador')
+    df_resultados = df_resultados[['Partidas', 'Vitorias', 'Derrotas', 'Empates']]
+
+    return ordenar(calcular_pontos(df_resultados))
@@ -0,0 +1,70 @@
+'''
+    Matriz de companheiros de time.
+
+    Conta, para cada par de jogadores, quantas vezes jogaram no mesmo time,
+    separadas pelo resultado do time (vitória, empate ou derrota). A matriz é
+    calculada uma única vez para o conjunto de partidas filtradas, com produtos
+    de matrizes NumPy sobre a tabela de incidência times x jogadores (uma linha
+    por time em cada partida, ver utils.ingestao.compilar_participacoes). A
+    análise de um jogador passa a ser apenas a leitura da sua linha.
+
+    A diagonal guarda as partidas do próprio jogador com cada resultado.
+'''
+import numpy as np
+import pandas as pd
+
+from utils.classificacao import COLUNAS_RESULTADOS
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def matriz_companheiros(df_participacoes):
+    '''
+        Retorna o dicionário {coluna: DataFrame} com uma matriz jogadores x
+        jogadores para cada resultado (colunas Vitorias, Derrotas e Empates).
+        Os jogadores seguem a ordem dos identificadores (ver utils.jogadores).
+    '''
+    jogadores = df_participacoes['Jogador'].astype('category')
+    ids = jogadores.cat.codes.to_numpy()
+    presentes = np.unique(ids[ids >= 0])
+    nomes = pd.Index(jogadores.cat.categories[presentes], name='Jogador')
+
+    # Time (partida e lado) de cada participação e resultado de cada time
+    equipes = df_participacoes.groupby(['Partida', 'Time'], observed=True, sort=False).ngroup().to_numpy()
+    resultados = df_participacoes['Resultado'].to_numpy()
+    resultado_equipe = np.empty(equipes.max() + 1 if len(equipes) else 0, dtype=object)
+    resultado_equipe[equipes] = resultados
+
+    # Tabela de incidência times x jogadores
+    validas = ids >= 0
+    incidencia = np.zeros((len(resultado_equipe), len(presentes)), dtype=np.int32)
+    incidencia[equipes[validas], np.searchsorted(presentes, ids[validas])] = 1
+
+    matrizes = {}
+    for resultado, coluna in COLUNAS_RESULTADOS.items():
+        parcial = incidencia[resultado_equipe == resultado]
+        matrizes[coluna] = pd.DataFrame(parcial.T @ parcial, index=nomes, columns=nomes)
+
+    return matrizes
+
+
+
+def linha_companheiros(matrizes, jogador):
+    '''
+        Retorna um DataFrame indexado pelos companheiros do jogador com as
+        colunas Partidas, Vitorias, Derrotas e Empates dos jogos em que estiveram
+        no mesmo time (mesmo formato de utils.classificacao.contar_resultados)
+    '''
+    colunas = list(COLUNAS_RESULTADOS.values())
+    if jogador not in matrizes[colunas[0]].index:
+        return pd.DataFrame(columns=['Partidas'] + colunas, index=pd.Index([], name='Jogador'), dtype='int32')
+
+    df_companheiros = pd.DataFrame({coluna: matrizes[coluna].loc[jogador] for coluna in colunas})
+    df_companheiros = df_companheiros.drop(index=jogador)
+    df_companheiros.insert(0, 'Partidas', df_companheiros.sum(axis=1))
+
+    # Companheiros em ordem alfabética (a ordem das matrizes é a do dicionário de jogadores)
+    return df_companheiros[df_companheiros['Partidas'] > 0].sort_index()
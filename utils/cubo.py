@@ -0,0 +1,107 @@
+'''
+    Cubo agregado temporada x mês x local x jogador x resultado.
+
+    Cada célula guarda medidas aditivas (Partidas, Pontos, Gols e Assistencias)
+    de um jogador em uma combinação de temporada, mês, local e resultado do
+    seu time. Qualquer combinação dos filtros das páginas (temporadas, meses,
+    locais) é respondida somando células, sem voltar às linhas de gols e de
+    partidas, e o tamanho do cubo depende do número de combinações, não do
+    número de partidas.
+
+    O cubo é gravado com os demais agregados da temporada (ver utils.agregados),
+    então também é somado ao anexar rodadas e ao combinar temporadas.
+'''
+import numpy as np
+import pandas as pd
+
+from utils.classificacao import COLUNAS_RESULTADOS, PONTOS_EMPATE, PONTOS_VITORIA
+
+
+# Dimensões (chave) e medidas do cubo
+DIMENSOES = ['Ano', 'Mes', 'Local', 'Jogador', 'Resultado']
+MEDIDAS = ['Partidas', 'Pontos', 'Gols', 'Assistencias']
+
+# Resultado dos gols e assistências de quem não está nos times da partida (ex.: "Gol Contra")
+SEM_PARTIDA = '-'
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def contar_eventos(df_eventos, coluna, resultados, medida):
+    '''
+        Conta os gols (coluna='Goleador') ou as assistências (coluna='Assistente')
+        por célula do cubo, com o resultado do time do jogador na partida
+    '''
+    df_eventos = df_eventos.loc[df_eventos[coluna] != '-', ['Partida', 'Ano', 'Mes', 'Local', coluna]]
+    df_eventos = df_eventos.rename(columns={coluna: 'Jogador'}).merge(resultados, on=['Partida', 'Jogador'], how='left')
+    df_eventos['Resultado'] = df_eventos['Resultado'].astype(object).fillna(SEM_PARTIDA)
+
+    return df_eventos.groupby(DIMENSOES, observed=True).size().rename(medida).reset_index()
+
+
+
+def montar(df, df_vd, df_participacoes):
+    '''
+        Retorna o cubo (colunas DIMENSOES e MEDIDAS) a partir dos gols (df),
+        dos resultados (df_vd) e das participações
+    '''
+    partidas = df_participacoes.groupby(DIMENSOES, observed=True).size().rename('Partidas').reset_index()
+
+    # Local de cada gol pelo identificador da partida
+    df_eventos = df[['Partida', 'Ano', 'Mes', 'Goleador', 'Assistente']].assign(
+        Local=df['Partida'].map(df_vd.set_index('Partida')['Local']))
+    # Um resultado por jogador em cada partida: se o jogador aparece nos dois times
+    # (erro na planilha), os seus gols contam uma vez só, no primeiro time
+    resultados = df_participacoes[['Partida', 'Jogador', 'Resultado']].drop_duplicates(['Partida', 'Jogador'])
+
+    partes = [
+        partidas,
+        contar_eventos(df_eventos, 'Goleador', resultados, 'Gols'),
+        contar_eventos(df_eventos, 'Assistente', resultados, 'Assistencias')
+    ]
+
+    # Categorias diferentes viram object na concatenação (os jogadores mantêm o
+    # dicionário quando já são categóricos, ver utils.jogadores)
+    df_cubo = pd.concat(partes, ignore_index=True)
+    df_cubo = df_cubo.astype({coluna: object for coluna in DIMENSOES if coluna != 'Jogador'})
+    df_cubo = df_cubo.groupby(DIMENSOES, sort=False, observed=True).sum().reset_index()
+
+    pontos = df_cubo['Resultado'].map({'Vitoria': PONTOS_VITORIA, 'Empate': PONTOS_EMPATE}).fillna(0)
+    df_cubo['Pontos'] = df_cubo['Partidas'] * pontos
+
+    return df_cubo[DIMENSOES + MEDIDAS].astype({medida: int for medida in MEDIDAS})
+
+
+
+def filtrar(df_cubo, anos=None, meses=None, locais=None):
+    '''
+        Retorna as células do cubo das temporadas, meses e locais informados
+        (None: sem filtro na dimensão)
+    '''
+    mascara = np.ones(len(df_cubo), dtype=bool)
+    for coluna, valores in (('Ano', anos), ('Mes', meses), ('Local', locais)):
+        if valores is not None:
+            mascara &= df_cubo[coluna].isin(list(valores)).to_numpy()
+
+    return df_cubo[mascara]
+
+
+
+def totais_jogadores(df_cubo):
+    '''
+        Soma as células do cubo por jogador. Retorna um DataFrame com as colunas
+        Jogador, Partidas, Vitorias, Derrotas, Empates, Pontos, Gols e
+        Assistencias (mesmo formato de utils.agregados.agregar_jogadores)
+    '''
+    medidas = df_cubo.groupby('Jogador', observed=True)[MEDIDAS].sum()
+
+    por_resultado = df_cubo.groupby(['Jogador', 'Resultado'], observed=True)['Partidas'].sum().unstack(fill_value=0)
+    por_resultado = por_resultado.reindex(columns=list(COLUNAS_RESULTADOS), fill_value=0).rename(columns=COLUNAS_RESULTADOS)
+
+    df_totais = medidas.join(por_resultado).fillna(0).astype(int)
+    df_totais = df_totais[['Partidas', 'Vitorias', 'Derrotas', 'Empates', 'Pontos', 'Gols', 'Assistencias']]
+
+    return df_totais.reset_index()
@@ -0,0 +1,217 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+import streamlit as st
+
+from utils import acumulados, agregados, banco, esquema, indices, ingestao, jogadores
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def ler_tabela_mapeada(caminho):
+    '''
+        Lê uma tabela Arrow IPC mapeada em memória (mmap).
+
+        Os buffers do Arrow apontam direto para o arquivo mapeado e as colunas
+        numéricas e de data sem valores ausentes viram arrays pandas sem cópia
+        (somente leitura). Como as páginas do arquivo ficam no cache do sistema
+        operacional, todos os processos que abrem o mesmo arquivo compartilham a
+        mesma memória física.
+    '''
+    tabela = feather.read_table(caminho, memory_map=True)
+
+    # split_blocks evita consolidar as colunas em blocos 2D (o que exigiria cópia)
+    df = tabela.to_pandas(split_blocks=True)
+
+    # O Arrow devolve textos ausentes como None; as páginas esperam NaN, como no Excel
+    colunas_texto = df.select_dtypes('object').columns
+    # (where mantém as colunas como object, sem o aviso de conversão do fillna)
+    df[colunas_texto] = df[colunas_texto].where(df[colunas_texto].notna(), np.nan)
+
+    return df
+
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _ler_particao(particao, assinatura_manifesto):
+    '''
+        Abre as tabelas de uma partição (temporada) uma única vez por processo.
+        A assinatura do manifesto faz parte da chave: uma nova ingestão invalida o cache.
+    '''
+    tabelas = {}
+    for tabela in ingestao.TABELAS:
+        tabelas[tabela] = ler_tabela_mapeada(os.path.join(particao, f'{tabela}.arrow'))
+
+    # Índices bitmap de local e mês, montados uma vez junto com as tabelas
+    tabelas['indices'] = indices.indexar(tabelas['gols'], tabelas['resultados'])
+
+    return tabelas
+
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _compilar_planilhas(ano, assinaturas_fontes):
+    '''
+        Lê e limpa as planilhas de uma temporada uma única vez por processo quando
+        a partição não existe ou está desatualizada.
+        As assinaturas (mtime, tamanho) das planilhas fazem parte da chave do cache.
+    '''
+    tabelas = ingestao.compilar(ano, ingestao.descobrir_temporadas()[ano])
+    tabelas['indices'] = indices.indexar(tabelas['gols'], tabelas['resultados'])
+
+    return tabelas
+
+
+
+def listar_temporadas():
+    '''
+        Retorna a lista ordenada de temporadas disponíveis (com planilhas ou partição)
+    '''
+    anos = set(ingestao.descobrir_temporadas()) | set(ingestao.listar_particoes())
+
+    return sorted(anos)
+
+
+
+def versao_temporada(ano):
+    '''
+        Retorna a origem dos dados da temporada e a sua assinatura: ('particao',
+        assinatura do manifesto) quando a partição está atualizada e, caso
+        contrário, ('planilhas', assinaturas das planilhas). Muda sempre que os
+        dados da temporada mudam.
+    '''
+    fontes = ingestao.descobrir_temporadas().get(ano)
+
+    if ingestao.particao_atualizada(ano, fontes):
+        caminho_manifesto = os.path.join(ingestao.dir_particao(ano), ingestao.ARQUIVO_MANIFESTO)
+        return 'particao', ingestao.assinatura_arquivo(caminho_manifesto)
+
+    return 'planilhas', tuple(ingestao.assinatura_arquivo(caminho) for caminho in fontes.values())
+
+
+
+def versao_dados(anos):
+    '''
+        Versão dos dados das temporadas selecionadas (ver versao_temporada),
+        usada nas chaves do cache de figuras (ver utils.figuras)
+    '''
+    return tuple(versao_temporada(ano) for ano in anos)
+
+
+
+def usar_banco(anos):
+    '''
+        Indica se as páginas devem consultar o banco SQLite (ver utils.banco):
+        backend ativo e temporadas gravadas no banco a partir das partições
+        atuais. Caso contrário (ingestão sem --sqlite, partição desatualizada),
+        os gols e as partidas vêm das partições, como as demais tabelas.
+    '''
+    if not banco.ativo():
+        return False
+
+    gravadas = banco.versoes()
+    for ano in anos:
+        if versao_temporada(ano)[0] != 'particao' or gravadas.get(ano) != ingestao.assinatura_manifesto(ano):
+            return False
+
+    return True
+
+
+
+def carregar_temporada(ano):
+    '''
+        Retorna o dicionário de tabelas compiladas de uma temporada.
+        Lê só a partição da temporada quando ela está atualizada e, caso contrário,
+        volta a ler as planilhas Excel da temporada.
+    '''
+    origem, assinatura = versao_temporada(ano)
+
+    if origem == 'particao':
+        return _ler_particao(ingestao.dir_particao(ano), assinatura)
+
+    return _compilar_planilhas(ano, assinatura)
+
+
+
+def carregar_dados(anos):
+    '''
+        Retorna os DataFrames de gols (df) e de resultados (df_vd) das temporadas
+        selecionadas, já com as colunas Mes e Ano e o placar dividido em Time A e
+        Time B. Apenas as partições dessas temporadas são lidas.
+
+        Os DataFrames são compartilhados por todas as páginas e sessões, portanto
+        devem ser tratados como somente leitura: filtre ou copie antes de alterar.
+    '''
+    tabelas = [carregar_temporada(ano) for ano in anos]
+
+    # Uma temporada: devolve os DataFrames compartilhados sem concatenar (sem cópia)
+    if len(tabelas) == 1:
+        return tabelas[0]['gols'], tabelas[0]['resultados']
+
+    # Categorias diferentes viram object na concatenação: compacta de novo
+    df = esquema.compactar_gols(jogadores.concatenar([t['gols'] for t in tabelas]))
+    df_vd = esquema.compactar_resultados(pd.concat([t['resultados'] for t in tabelas], ignore_index=True))
+
+    return df, df_vd
+
+
+
+def carregar_indices(anos):
+    '''
+        Retorna os índices bitmap de local e mês (ver utils.indices) das tabelas
+        de gols e de resultados devolvidas por carregar_dados(anos)
+    '''
+    if len(anos) == 1:
+        return carregar_temporada(anos[0])['indices']
+
+    return indices.indexar(*carregar_dados(anos))
+
+
+
+def carregar_participacoes(anos):
+    '''
+        Retorna a tabela de participações (uma linha por jogador em cada partida,
+        ver utils.ingestao.compilar_participacoes) das temporadas selecionadas.
+        Compartilhada entre as sessões: trate como somente leitura.
+    '''
+    tabelas = [carregar_temporada(ano)['participacoes'] for ano in anos]
+
+    if len(tabelas) == 1:
+        return tabelas[0]
+
+    return esquema.compactar_participacoes(jogadores.concatenar(tabelas))
+
+
+
+def carregar_agregados(anos):
+    '''
+        Retorna o dicionário de agregados aditivos (ver utils.agregados) das
+        temporadas selecionadas, somados quando há mais de uma temporada.
+    '''
+    tabelas = [carregar_temporada(ano) for ano in anos]
+
+    soma = {tabela: tabelas[0][tabela] for tabela in agregados.CHAVES}
+    for tabelas_temporada in tabelas[1:]:
+        soma = agregados.somar_agregados(soma, tabelas_temporada)
+
+    return soma
+
+
+
+def carregar_acumulados(anos):
+    '''
+        Retorna a tabela de contadores acumulados por data de rodada (ver
+        utils.acumulados) das temporadas selecionadas, encadeadas quando há
+        mais de uma temporada. Compartilhada entre as sessões: trate como somente leitura.
+    '''
+    tabelas = [carregar_temporada(ano)['acumulados'] for ano in sorted(anos)]
+
+    if len(tabelas) == 1:
+        return tabelas[0]
+
+    return acumulados.encadear(tabelas)
@@ -0,0 +1,152 @@
+'''
+    Esquema das planilhas de gols e de resultados.
+
+    Valida as colunas esperadas de cada planilha, descarta as linhas malformadas
+    antes que cheguem às páginas e compacta os tipos das colunas:
+        - textos repetidos (local, mês, ano, placar, tipo de gol) como categóricos; as colunas
+          de jogadores usam o dicionário de jogadores (ver utils.jogadores)
+        - números (partida, minuto, placar dividido) no menor tipo inteiro que os comporta
+'''
+import warnings
+
+import numpy as np
+import pandas as pd
+
+
+# Colunas obrigatórias de cada planilha
+COLUNAS_GOLS = ['Data', 'Goleador', 'Assistente', 'Minuto', 'Placar']
+COLUNAS_RESULTADOS = ['Data', 'Local', 'Time Vencedor', 'Time Perdedor', 'Time Empate 1', 'Time Empate 2']
+
+# Colunas de texto com poucos valores distintos, guardadas como categóricas
+CATEGORICAS_GOLS = ['Placar', 'Tipo de Gol', 'Mes', 'Ano']
+CATEGORICAS_RESULTADOS = ['Local', 'Mes', 'Ano']
+CATEGORICAS_PARTICIPACOES = ['Local', 'Mes', 'Ano', 'Time', 'Resultado']
+
+# Colunas inteiras (com valores ausentes), guardadas no menor tipo inteiro possível
+INTEIRAS_GOLS = ['Partida', 'Minuto', 'Time A', 'Time B']
+
+# Placar válido: gols do Time A, "x" ou "-", gols do Time B
+PADRAO_PLACAR = r'\d+[x-]\d+'
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def validar_colunas(df, colunas, planilha):
+    '''
+        Lança ValueError se faltar alguma das colunas obrigatórias na planilha
+    '''
+    faltando = [coluna for coluna in colunas if coluna not in df.columns]
+    if faltando:
+        raise ValueError(f'Planilha de {planilha} sem as colunas obrigatórias: {", ".join(faltando)}')
+
+
+
+def descartar_linhas(df, invalidas, motivo):
+    '''
+        Remove as linhas marcadas em invalidas (máscara booleana), avisando quantas foram
+    '''
+    if invalidas.any():
+        warnings.warn(f'{invalidas.sum()} linha(s) descartada(s): {motivo}', stacklevel=3)
+
+    return df[~invalidas].reset_index(drop=True)
+
+
+
+def validar_gols(df):
+    '''
+        Valida a planilha de gols bruta (antes da limpeza):
+            - colunas obrigatórias presentes
+            - Data e Goleador preenchidos
+            - Minuto numérico, inteiro e não negativo
+            - Placar vazio ou no formato "A-B" / "AxB"
+    '''
+    validar_colunas(df, COLUNAS_GOLS, 'gols')
+
+    df = descartar_linhas(df, df['Data'].isna() | df['Goleador'].isna(), 'gol sem Data ou sem Goleador')
+
+    minuto = pd.to_numeric(df['Minuto'], errors='coerce')
+    invalido = (df['Minuto'].notna() & minuto.isna()) | (minuto < 0) | (minuto % 1 > 0)
+    df = descartar_linhas(df, invalido, 'Minuto não é um inteiro não negativo')
+
+    placar = df['Placar'].astype(object)
+    invalido = placar.notna() & ~placar.astype(str).str.fullmatch(PADRAO_PLACAR)
+    df = descartar_linhas(df, invalido, 'Placar fora do formato "A-B"')
+
+    return df
+
+
+
+def validar_resultados(df_vd):
+    '''
+        Valida a planilha de resultados bruta (antes da limpeza):
+            - colunas obrigatórias presentes
+            - Data e Local preenchidos
+    '''
+    validar_colunas(df_vd, COLUNAS_RESULTADOS, 'resultados')
+
+    return descartar_linhas(df_vd, df_vd['Data'].isna() | df_vd['Local'].isna(), 'partida sem Data ou sem Local')
+
+
+
+def menor_inteiro(serie):
+    '''
+        Converte a Series numérica para o menor tipo inteiro com suporte a
+        valores ausentes (Int8, Int16, Int32 ou Int64) que comporta os seus valores
+    '''
+    serie = pd.to_numeric(serie)
+    if serie.isna().all():
+        return serie.astype('Int8')
+
+    minimo, maximo = serie.min(), serie.max()
+    for tipo in ('Int8', 'Int16', 'Int32'):
+        limites = np.iinfo(tipo.lower())
+        if limites.min <= minimo and maximo <= limites.max:
+            return serie.astype(tipo)
+
+    return serie.astype('Int64')
+
+
+
+def compactar(df, categoricas, inteiras=()):
+    '''
+        Compacta os tipos das colunas do DataFrame (as colunas ausentes são ignoradas).
+        Pode ser aplicada de novo depois de concatenar DataFrames já compactados.
+    '''
+    for coluna in categoricas:
+        if coluna in df.columns:
+            df[coluna] = df[coluna].astype('category')
+
+    for coluna in inteiras:
+        if coluna in df.columns:
+            df[coluna] = menor_inteiro(df[coluna])
+
+    return df
+
+
+
+def compactar_gols(df):
+    '''
+        Compacta os tipos da tabela de gols já limpa
+    '''
+    return compactar(df, CATEGORICAS_GOLS, INTEIRAS_GOLS)
+
+
+
+def compactar_resultados(df_vd):
+    '''
+        Compacta os tipos da tabela de resultados já limpa
+    '''
+    return compactar(df_vd, CATEGORICAS_RESULTADOS)
+
+
+
+def compactar_participacoes(df_participacoes):
+    '''
+        Compacta os tipos da tabela de participações (ver utils.ingestao.compilar_participacoes)
+    '''
+    df_participacoes['Partida'] = df_participacoes['Partida'].astype('int32')
+
+    return compactar(df_participacoes, CATEGORICAS_PARTICIPACOES)
@@ -0,0 +1,92 @@
+'''
+    Cache das figuras Plotly das páginas por estado dos filtros.
+
+    Cada figura é identificada por uma chave com o gráfico e tudo o que define
+    o seu conteúdo (temporada, locais, data limite, jogador e versão dos dados,
+    ver utils.dados.versao_dados). Na primeira vez, a função que agrega os
+    dados e monta a figura é executada e a figura é guardada serializada
+    (JSON); nas seguintes, por qualquer sessão, a figura é reconstruída do
+    JSON sem validar as propriedades de novo, sem refazer a agregação nem a
+    construção do Plotly.
+
+    O cache é do processo (compartilhado entre as sessões), com descarte LRU
+    quando o tamanho total dos JSONs passa de LIMITE_BYTES. As figuras
+    devolvidas são cópias: podem ser alteradas antes de exibir.
+'''
+import json
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+
+# Tamanho máximo (bytes) dos JSONs guardados
+LIMITE_BYTES = 64 * 1024 * 1024
+
+_figuras = OrderedDict()
+_tamanho = 0
+_trava = threading.Lock()
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def guardar(chave, texto):
+    '''
+        Guarda o JSON da figura e descarta as figuras usadas há mais tempo
+        enquanto o total passar de LIMITE_BYTES
+    '''
+    global _tamanho
+
+    with _trava:
+        if chave in _figuras:
+            _tamanho -= len(_figuras.pop(chave))
+
+        _figuras[chave] = texto
+        _tamanho += len(texto)
+
+        while _tamanho > LIMITE_BYTES and len(_figuras) > 1:
+            _, descartado = _figuras.popitem(last=False)
+            _tamanho -= len(descartado)
+
+
+
+def ler(chave):
+    '''
+        Retorna o JSON guardado da figura (None se não estiver no cache)
+    '''
+    with _trava:
+        texto = _figuras.get(chave)
+        if texto is not None:
+            _figuras.move_to_end(chave)
+
+    return texto
+
+
+
+def obter(chave, construir):
+    '''
+        Retorna a figura da chave: reconstruída do cache ou montada por
+        construir() (função sem argumentos) e guardada
+    '''
+    texto = ler(chave)
+    if texto is None:
+        texto = construir().to_json()
+        guardar(chave, texto)
+
+    # O JSON foi gerado a partir de uma figura válida: dispensa a validação
+    return go.Figure(json.loads(texto), _validate=False)
+
+
+
+def limpar():
+    '''
+        Descarta todas as figuras do cache
+    '''
+    global _tamanho
+
+    with _trava:
+        _figuras.clear()
+        _tamanho = 0
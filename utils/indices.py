@@ -0,0 +1,114 @@
+'''
+    Índices bitmap de local e de mês das tabelas de gols e de partidas.
+
+    Para cada local e para cada mês, um array de bits compactado (np.packbits)
+    marca as linhas da tabela com aquele valor. Os filtros das páginas (locais
+    selecionados, data limite, mês) viram operações OR/AND sobre esses arrays
+    e as linhas resultantes são lidas com uma única seleção (DataFrame.take),
+    em vez de comparar todas as linhas de cada tabela a cada interação.
+
+    A data limite usa os bitmaps de mês: os meses que terminam até a data
+    entram inteiros e apenas as linhas do mês que contém a data são comparadas.
+
+    Os índices são montados uma vez por temporada carregada (ver utils.dados).
+'''
+import numpy as np
+import pandas as pd
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def criar_bitmaps(valores):
+    '''
+        Retorna o dicionário {valor: bits} com um array de bits compactado por
+        valor distinto da Series (valores ausentes não são indexados)
+    '''
+    codigos, distintos = pd.factorize(valores)
+
+    return {valor: np.packbits(codigos == i) for i, valor in enumerate(distintos)}
+
+
+
+def indexar_tabela(datas, locais, meses):
+    '''
+        Monta o índice de uma tabela a partir das Series de Data, Local e Mes das
+        suas linhas (na ordem das linhas)
+    '''
+    datas_meses = datas.groupby(meses.to_numpy()).agg(['min', 'max'])
+
+    return {
+        'linhas': len(datas),
+        'Local': criar_bitmaps(locais),
+        'Mes': criar_bitmaps(meses),
+        'datas_meses': {mes: (inicio, fim) for mes, (inicio, fim) in datas_meses.iterrows()}
+    }
+
+
+
+def indexar(df, df_vd):
+    '''
+        Retorna os índices {'gols': índice, 'resultados': índice} dos gols (df)
+        e dos resultados (df_vd). O local de cada gol vem da sua partida.
+    '''
+    locais_gols = df['Partida'].map(df_vd.set_index('Partida')['Local'])
+
+    return {
+        'gols': indexar_tabela(df['Data'], locais_gols, df['Mes']),
+        'resultados': indexar_tabela(df_vd['Data'], df_vd['Local'], df_vd['Mes'])
+    }
+
+
+
+def uniao(indice, coluna, valores):
+    '''
+        OR dos bitmaps dos valores informados da coluna (Local ou Mes)
+    '''
+    bits = np.zeros((indice['linhas'] + 7) // 8, dtype=np.uint8)
+    for valor in valores:
+        if valor in indice[coluna]:
+            bits |= indice[coluna][valor]
+
+    return bits
+
+
+
+def bits_ate(indice, datas, data_max):
+    '''
+        Bitmap das linhas com Data até data_max (inclusive): OR dos meses que
+        terminam até a data mais as linhas do mês que contém a data
+    '''
+    completos = [mes for mes, (inicio, fim) in indice['datas_meses'].items() if fim <= data_max]
+    parciais = [mes for mes, (inicio, fim) in indice['datas_meses'].items() if inicio <= data_max < fim]
+
+    bits = uniao(indice, 'Mes', completos)
+    if parciais:
+        posicoes = np.flatnonzero(np.unpackbits(uniao(indice, 'Mes', parciais), count=indice['linhas']))
+        marcadas = np.zeros(indice['linhas'], dtype=bool)
+        marcadas[posicoes[datas.to_numpy()[posicoes] <= np.datetime64(data_max)]] = True
+        bits |= np.packbits(marcadas)
+
+    return bits
+
+
+
+def selecionar(indice, datas, locais=None, data_max=None, mes=None):
+    '''
+        Retorna as posições das linhas que atendem aos filtros (None: sem filtro).
+        datas: Series de Data da tabela indexada, usada apenas no mês que
+        contém data_max. Aplicar com DataFrame.take.
+    '''
+    bits = np.packbits(np.ones(indice['linhas'], dtype=bool))
+
+    if locais is not None:
+        bits &= uniao(indice, 'Local', locais)
+
+    if mes is not None:
+        bits &= uniao(indice, 'Mes', [mes])
+
+    if data_max is not None:
+        bits &= bits_ate(indice, datas, pd.Timestamp(data_max))
+
+    return np.flatnonzero(np.unpackbits(bits, count=indice['linhas']))
@@ -0,0 +1,638 @@
+'''
+    Compila as planilhas das temporadas em um armazenamento colunar (Arrow IPC)
+    particionado por temporada.
+
+    Cada temporada tem o seu par de planilhas (dataset/Futsal_<ano>_gols.xlsx e
+    dataset/Futsal_<ano>_game_results.xlsx) e a sua partição no armazenamento:
+
+        dataset/compilado/Ano=<ano>/gols.arrow
+        dataset/compilado/Ano=<ano>/resultados.arrow
+        dataset/compilado/Ano=<ano>/participacoes.arrow
+        dataset/compilado/Ano=<ano>/acumulados.arrow
+        dataset/compilado/Ano=<ano>/manifesto.json
+
+    As datas já são convertidas, as colunas Mes e Ano já são criadas e o Placar
+    já é dividido nas colunas inteiras Time A e Time B, com o tipo de cada gol
+    (Tipo de Gol) já classificado partida a partida. Cada partida recebe um
+    identificador (Partida), levado também a cada gol, e os times de cada partida são explodidos na tabela
+    participacoes, com uma linha por jogador em cada partida, para que as páginas
+    não precisem dividir os textos dos times. As planilhas são validadas
+    e os tipos compactados (categóricos e inteiros pequenos, ver utils.esquema).
+    Os jogadores são identificados pelo dicionário de jogadores compartilhado
+    entre as temporadas (dataset/compilado/jogadores.arrow, ver utils.jogadores).
+    Cada partição também guarda os agregados aditivos da temporada (ver
+    utils.agregados) e os contadores acumulados por data de rodada (ver
+    utils.acumulados).
+
+    Só as partições cujas planilhas mudaram são regravadas, então uma nova
+    temporada é adicionada sem tocar nas anteriores. Com --anexar, apenas as
+    rodadas posteriores à última data da partição são processadas e os seus
+    agregados são somados aos já gravados. As páginas leem apenas as partições
+    das temporadas selecionadas e só voltam a ler o Excel quando a partição não
+    existe ou está desatualizada.
+
+    Uso:
+        python -m utils.ingestao                     # todas as temporadas alteradas
+        python -m utils.ingestao --anexar            # apenas as rodadas novas
+        python -m utils.ingestao --temporada 2023    # apenas uma temporada
+        python -m utils.ingestao --forcar            # regrava mesmo sem alterações
+        python -m utils.ingestao --sqlite            # também grava no banco SQLite do destino (utils.banco)
+'''
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import warnings
+
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+
+from utils import acumulados, agregados, banco, esquema, jogadores
+
+
+# =====================================
+# Caminhos do dataset
+# =====================================
+
+
+DIR_DATASET = 'dataset'
+DIR_COMPILADO = 'dataset/compilado'
+ARQUIVO_MANIFESTO = 'manifesto.json'
+
+# Planilhas de cada temporada: o ano faz parte do nome do arquivo
+PADRAO_GOLS = 'Futsal_{ano}_gols.xlsx'
+PADRAO_RESULTADOS = 'Futsal_{ano}_game_results.xlsx'
+
+# Tabelas gravadas em cada partição
+TABELAS = ['gols', 'resultados', 'participacoes', 'acumulados'] + list(agregados.CHAVES)
+
+# Incrementar sempre que o formato das tabelas compiladas mudar
+VERSAO_ESQUEMA = 11
+
+# Tipos de gol, na ordem de exibição (categorias da coluna Tipo de Gol)
+TIPOS_GOL = ['Gol de Vantagem', 'Gol de Desconto', 'Gol de Empate', 'Gol Desempate', 'Gol de Virada']
+
+# Coluna de time -> resultado dos jogadores do time
+COLUNAS_TIMES = {
+    'Time Vencedor': 'Vitoria',
+    'Time Perdedor': 'Derrota',
+    'Time Empate 1': 'Empate',
+    'Time Empate 2': 'Empate'
+}
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+# Função para traduzir os meses para português sem acentos
+def traduzir_mes(mes_ingles):
+    traducao = {
+        'January': 'Janeiro',
+        'February': 'Fevereiro',
+        'March': 'Marco',
+        'April': 'Abril',
+        'May': 'Maio',
+        'June': 'Junho',
+        'July': 'Julho',
+        'August': 'Agosto',
+        'September': 'Setembro',
+        'October': 'Outubro',
+        'November': 'Novembro',
+        'December': 'Dezembro'
+    }
+    return traducao.get(mes_ingles, mes_ingles)
+
+
+
+def add_col_mes_ano(df):
+    '''
+        Adiciona as colunas Mes e Ano ao dataframe DF
+    '''
+    # Supondo que seu DataFrame seja df e tenha uma coluna chamada 'Data'
+    df['Data'] = pd.to_datetime(df['Data'], format='%d/%m/%Y')  # Converte a coluna 'Data' para datetime
+
+    # Criar a coluna 'Mes' com o nome do mês em inglês e traduzir para português
+    df['Mes'] = df['Data'].dt.strftime('%B')  # Extrai o mês em inglês
+    df['Mes'] = df['Mes'].apply(traduzir_mes)  # Traduz os meses para português sem acentos
+
+    # Criar a coluna 'Ano'
+    df['Ano'] = df['Data'].dt.year.astype(str)
+
+    return df
+
+
+
+def assinatura_arquivo(caminho):
+    '''
+        Retorna a tupla (mtime, tamanho) do arquivo.
+        Qualquer alteração no arquivo gera uma nova assinatura.
+    '''
+    stat = os.stat(caminho)
+    return stat.st_mtime_ns, stat.st_size
+
+
+
+def _normalizar_celula(valor):
+    if pd.isna(valor):
+        return ''
+    if isinstance(valor, (int, float, np.number)) and not isinstance(valor, bool):
+        return repr(float(valor))
+    return str(valor)
+
+
+
+def assinatura_linhas(df):
+    '''
+        Hash do conteúdo das linhas da planilha (validada, antes da limpeza).
+        As células são normalizadas para texto, com os números como float: as
+        mesmas linhas têm a mesma assinatura mesmo quando o tipo inferido de uma
+        coluna muda com as linhas novas (1 e 1.0).
+    '''
+    texto = df.astype(object).map(_normalizar_celula)
+    hashes = pd.util.hash_pandas_object(texto, index=False)
+
+    return hashlib.sha1(hashes.to_numpy().tobytes()).hexdigest()
+
+
+
+def compilar_gols(df, df_vd):
+    '''
+        Limpa a planilha de gols (df_vd: resultados já compilados, ver compilar_resultados):
+            - Data convertida e colunas Mes e Ano
+            - Partida de cada gol (ver atribuir_partidas)
+            - Placar padronizado como "A-B"
+            - Time A e Time B com o placar após o gol (inteiros)
+            - Tipo de Gol (ver classificar_gols)
+            - tipos compactados (ver utils.esquema)
+    '''
+    df = add_col_mes_ano(df)
+
+    # Nomes sem espaços sobrando (ver utils.jogadores)
+    df['Goleador'] = jogadores.normalizar(df['Goleador'])
+    df['Assistente'] = jogadores.normalizar(df['Assistente'])
+
+    # Substituir "x" por "-" (object: a coluna pode vir só com NaN em rodadas sem placar)
+    df['Placar'] = df['Placar'].astype(object).str.replace('x', '-')
+
+    # Dividir a coluna 'Placar' em duas colunas inteiras
+    placar = df['Placar'].str.split('-', expand=True).reindex(columns=[0, 1])
+    df['Time A'] = pd.to_numeric(placar[0]).astype('Int64')
+    df['Time B'] = pd.to_numeric(placar[1]).astype('Int64')
+
+    df.insert(0, 'Partida', atribuir_partidas(df, df_vd))
+    df['Tipo de Gol'] = classificar_gols(df)
+
+    return esquema.compactar_gols(df)
+
+
+
+def atribuir_partidas(df, df_vd):
+    '''
+        Retorna o identificador da partida (Partida) de cada gol, para que as
+        junções entre gols e partidas sejam consultas pela chave da partida e
+        não junções pela Data.
+
+        Os gols são ligados às partidas da mesma Data. Quando há mais de uma
+        partida na data, cada gol que deixa o placar com um gol no total (1-0
+        ou 0-1) abre a próxima partida da data, na ordem da planilha de
+        resultados. Gols em datas sem partida ficam sem identificador.
+
+        Limitação: um gol sem Placar não indica quando começa uma partida. Em
+        datas com mais de uma partida, ele fica na partida em andamento na
+        ordem da planilha (a primeira da data se nenhum gol anterior da data
+        tem placar), o que pode não ser a partida certa. A ingestão avisa
+        quantos gols estão nessa situação.
+    '''
+    # Ordem da partida dentro da sua data e número de partidas de cada data
+    ordem_partidas = df_vd.groupby('Data', sort=False).cumcount()
+    chaves = pd.MultiIndex.from_arrays([df_vd['Data'], ordem_partidas])
+    partidas_data = df_vd['Data'].value_counts()
+
+    # Gols sem placar em datas com várias partidas: partida incerta (ver a limitação acima)
+    incertos = df['Placar'].isna() & (df['Data'].map(partidas_data) > 1)
+    if incertos.any():
+        warnings.warn(f'{incertos.sum()} gol(s) sem Placar em datas com mais de uma partida: '
+                      'ligado(s) à partida em andamento da data', stacklevel=3)
+
+    # Ordem da partida de cada gol: quantas partidas já começaram na data
+    inicio = (df['Time A'] + df['Time B'] == 1).fillna(False).astype(int)
+    ordem_gols = inicio.groupby(df['Data'], sort=False).cumsum() - 1
+    ordem_gols = ordem_gols.clip(lower=0, upper=df['Data'].map(partidas_data).fillna(1) - 1)
+
+    posicoes = chaves.get_indexer(pd.MultiIndex.from_arrays([df['Data'], ordem_gols]))
+    partidas = pd.Series(df_vd['Partida'].to_numpy()[posicoes], index=df.index).astype('Int32')
+
+    return partidas.mask(posicoes < 0)
+
+
+
+def classificar_gols(df):
+    '''
+        Retorna uma Series categórica (categorias TIPOS_GOL) com o tipo de cada
+        gol, calculado partida a partida (por Partida, na ordem dos gols) a partir
+        do placar após o gol:
+            - primeiro gol da partida: Gol Desempate
+            - placar empatado: Gol de Empate
+            - diferença de 1 após um empate: Gol Desempate se o time que
+              estava à frente antes do empate voltou à frente, senão Gol de Virada
+            - diferença maior que 1 e aumentando: Gol de Vantagem
+            - diferença diminuindo: Gol de Desconto
+        Os gols sem placar ficam sem tipo (NaN) e não entram na sequência.
+    '''
+    placar = df.loc[df['Time A'].notna() & df['Time B'].notna(), ['Partida', 'Time A', 'Time B']]
+    partidas = placar['Partida'].fillna(-1)
+
+    saldo = (placar['Time A'] - placar['Time B']).astype(int)
+    diferenca = saldo.abs()
+    variacao = diferenca.groupby(partidas, sort=False).diff()
+    saldo_anterior = saldo.groupby(partidas, sort=False).shift(1)
+
+    # Último time à frente no placar dentro da partida (1 = Time A, -1 = Time B)
+    lider = np.sign(saldo).replace(0, np.nan).groupby(partidas, sort=False).ffill()
+    lider_anterior = lider.groupby(partidas, sort=False).shift(1)
+
+    desempatou = (diferenca == 1) & (saldo_anterior == 0)
+
+    # A primeira condição verdadeira define o tipo
+    tipos = np.select(
+        [
+            saldo.groupby(partidas, sort=False).cumcount() == 0,
+            desempatou & (lider == lider_anterior),
+            desempatou,
+            (diferenca > 0) & (variacao < 0),
+            (diferenca > 1) & (variacao > 0),
+            saldo == 0
+        ],
+        ['Gol Desempate', 'Gol Desempate', 'Gol de Virada', 'Gol de Desconto', 'Gol de Vantagem', 'Gol de Empate'],
+        default=None
+    )
+
+    tipos = pd.Series(pd.Categorical(tipos, categories=TIPOS_GOL), index=placar.index)
+
+    return tipos.reindex(df.index)
+
+
+
+def compilar_resultados(df_vd, ano, inicio=0):
+    '''
+        Limpa a planilha de resultados: Data convertida, colunas Mes e Ano,
+        identificador da partida e tipos compactados (ver utils.esquema).
+
+        Partida = <ano da temporada> * 10000 + número da partida na temporada
+        (a partir de 1). inicio é o número de partidas já compiladas da temporada
+        (ver anexar), para que os identificadores continuem a sequência.
+    '''
+    df_vd = add_col_mes_ano(df_vd)
+
+    df_vd.insert(0, 'Partida', (int(ano) * 10000 + inicio + np.arange(1, len(df_vd) + 1)).astype('int32'))
+
+    return esquema.compactar_resultados(df_vd)
+
+
+
+def compilar_participacoes(df_vd):
+    '''
+        Explode os times de cada partida em uma tabela longa, com uma linha por
+        jogador em cada partida e as colunas:
+            - Partida, Data, Local, Mes, Ano
+            - Jogador
+            - Time (coluna de origem: Time Vencedor, Time Perdedor, Time Empate 1/2)
+            - Resultado (Vitoria, Derrota ou Empate)
+        As linhas seguem a ordem das partidas e, em cada partida, a ordem dos
+        times e dos jogadores na planilha.
+    '''
+    partes = []
+    for ordem, (coluna, resultado) in enumerate(COLUNAS_TIMES.items()):
+        # Nomes separados por vírgula e sem espaços sobrando (ver utils.jogadores)
+        nomes = jogadores.normalizar(df_vd[coluna].dropna().astype(str).str.split(',').explode())
+        parte = df_vd.loc[nomes.index, ['Partida', 'Data', 'Local', 'Mes', 'Ano']]
+        parte['Jogador'] = nomes.values
+        parte['Time'] = coluna
+        parte['Resultado'] = resultado
+        parte['_ordem'] = ordem
+        partes.append(parte)
+
+    # Ordem estável: partida, time e posição do jogador no time
+    df_participacoes = pd.concat(partes).sort_values(['Partida', '_ordem'], kind='stable')
+    df_participacoes = df_participacoes.drop(columns='_ordem').reset_index(drop=True)
+
+    return esquema.compactar_participacoes(df_participacoes)
+
+
+
+def descobrir_temporadas(diretorio=DIR_DATASET):
+    '''
+        Retorna um dicionário {ano: {'gols': caminho, 'resultados': caminho}} com
+        as temporadas que possuem as duas planilhas no diretório do dataset
+    '''
+    temporadas = {}
+    for caminho in glob.glob(os.path.join(diretorio, PADRAO_GOLS.format(ano='*'))):
+        encontrado = re.fullmatch(r'Futsal_(\d{4})_gols\.xlsx', os.path.basename(caminho))
+        if encontrado is None:
+            continue
+
+        ano = encontrado.group(1)
+        caminho_resultados = os.path.join(diretorio, PADRAO_RESULTADOS.format(ano=ano))
+        if os.path.exists(caminho_resultados):
+            temporadas[ano] = {'gols': caminho, 'resultados': caminho_resultados}
+
+    return dict(sorted(temporadas.items()))
+
+
+
+def dir_particao(ano, diretorio=DIR_COMPILADO):
+    '''
+        Retorna o diretório da partição da temporada no armazenamento compilado
+    '''
+    return os.path.join(diretorio, f'Ano={ano}')
+
+
+
+def listar_particoes(diretorio=DIR_COMPILADO):
+    '''
+        Retorna a lista de temporadas que possuem partição no armazenamento compilado
+    '''
+    anos = []
+    for caminho in glob.glob(os.path.join(diretorio, 'Ano=*', ARQUIVO_MANIFESTO)):
+        anos.append(os.path.basename(os.path.dirname(caminho)).split('=', 1)[1])
+
+    return sorted(anos)
+
+
+
+def ler_planilhas(ano, fontes, linhas=None):
+    '''
+        Lê, valida e limpa as planilhas de uma temporada.
+        fontes: {'gols': caminho, 'resultados': caminho} (ver descobrir_temporadas)
+        linhas: quando informado, recebe as assinaturas do conteúdo das
+        planilhas {'gols': hash, 'resultados': hash} (ver assinatura_linhas)
+
+        Retorna os DataFrames de gols (df) e de resultados (df_vd)
+    '''
+    df_bruto = esquema.validar_gols(pd.read_excel(fontes['gols']))
+    df_vd_bruto = esquema.validar_resultados(pd.read_excel(fontes['resultados']))
+
+    if linhas is not None:
+        linhas['gols'] = assinatura_linhas(df_bruto)
+        linhas['resultados'] = assinatura_linhas(df_vd_bruto)
+
+    df_vd = compilar_resultados(df_vd_bruto, ano)
+    df = compilar_gols(df_bruto, df_vd)
+
+    return df, df_vd
+
+
+
+def compilar(ano, fontes, dicionario=None, linhas=None):
+    '''
+        Lê as planilhas de uma temporada e retorna o dicionário de tabelas compiladas
+        (gols, resultados, participacoes, acumulados e agregados).
+
+        dicionario: lista de nomes do dicionário de jogadores, estendida com os
+        jogadores novos da temporada. Quando não é informado, o dicionário gravado
+        é lido e estendido apenas em memória.
+        linhas: quando informado, recebe as assinaturas do conteúdo das
+        planilhas (ver ler_planilhas), gravadas no manifesto da partição.
+    '''
+    if dicionario is None:
+        dicionario = jogadores.ler_dicionario(DIR_COMPILADO)
+
+    df, df_vd = ler_planilhas(ano, fontes, linhas)
+    df_participacoes = compilar_participacoes(df_vd)
+
+    tabelas = {'gols': df, 'resultados': df_vd, 'participacoes': df_participacoes}
+    tabelas['acumulados'] = acumulados.acumular(df, df_participacoes)
+    tabelas.update(agregados.agregar(df, df_vd, df_participacoes))
+
+    # Jogadores como identificadores do dicionário em todas as tabelas
+    jogadores.internar(tabelas, dicionario)
+
+    return tabelas
+
+
+
+def ler_particao(ano, diretorio=DIR_COMPILADO):
+    '''
+        Lê todas as tabelas gravadas na partição da temporada
+    '''
+    particao = dir_particao(ano, diretorio)
+
+    tabelas = {}
+    for tabela in TABELAS:
+        tabelas[tabela] = feather.read_feather(os.path.join(particao, f'{tabela}.arrow'))
+
+    return tabelas
+
+
+
+def anexar(ano, fontes, diretorio=DIR_COMPILADO, dicionario=None, linhas=None):
+    '''
+        Acrescenta à partição apenas as rodadas posteriores à última data gravada
+        e soma os agregados dessas rodadas aos agregados já gravados (os
+        acumulados são encadeados aos já gravados).
+        dicionario e linhas: como em compilar.
+
+        Retorna o dicionário de tabelas atualizado ou None quando não é possível
+        anexar (partição inexistente, versão antiga ou rodadas antigas alteradas);
+        nesse caso a temporada deve ser compilada por completo.
+    '''
+    particao = dir_particao(ano, diretorio)
+    manifesto = ler_manifesto(particao)
+    if manifesto is None or manifesto.get('versao') != VERSAO_ESQUEMA:
+        return None
+
+    if dicionario is None:
+        dicionario = jogadores.ler_dicionario(diretorio)
+
+    tabelas = ler_particao(ano, diretorio)
+
+    ultima_data = tabelas['resultados']['Data'].max()
+
+    df_bruto = esquema.validar_gols(pd.read_excel(fontes['gols']))
+    df_vd_bruto = esquema.validar_resultados(pd.read_excel(fontes['resultados']))
+
+    # Apenas as rodadas posteriores à última data gravada são limpas e agregadas
+    novos_gols = pd.to_datetime(df_bruto['Data'], format='%d/%m/%Y') > ultima_data
+    novas_partidas = pd.to_datetime(df_vd_bruto['Data'], format='%d/%m/%Y') > ultima_data
+
+    # As linhas já gravadas precisam continuar na planilha como estavam (mesmo
+    # conteúdo, comparado com as assinaturas do manifesto): se alguma rodada
+    # antiga foi editada, só a compilação completa mantém os agregados corretos
+    gravadas = manifesto.get('linhas') or {}
+    if (assinatura_linhas(df_bruto[~novos_gols]) != gravadas.get('gols')
+            or assinatura_linhas(df_vd_bruto[~novas_partidas]) != gravadas.get('resultados')):
+        return None
+
+    if linhas is not None:
+        linhas['gols'] = assinatura_linhas(df_bruto)
+        linhas['resultados'] = assinatura_linhas(df_vd_bruto)
+
+    df_vd_novo = compilar_resultados(df_vd_bruto[novas_partidas].reset_index(drop=True), ano, len(tabelas['resultados']))
+    df_novo = compilar_gols(df_bruto[novos_gols].reset_index(drop=True), df_vd_novo)
+    df_participacoes_novo = compilar_participacoes(df_vd_novo)
+
+    if df_vd_novo.empty and df_novo.empty:
+        return tabelas
+
+    novos = {'gols': df_novo, 'participacoes': df_participacoes_novo}
+    novos.update(agregados.agregar(df_novo, df_vd_novo, df_participacoes_novo))
+    jogadores.internar(novos, dicionario)
+
+    # Categorias diferentes viram object na concatenação: compacta de novo
+    # (os jogadores mantêm os identificadores do dicionário, ver utils.jogadores)
+    tabelas['gols'] = esquema.compactar_gols(jogadores.concatenar([tabelas['gols'], novos['gols']]))
+    tabelas['resultados'] = esquema.compactar_resultados(pd.concat([tabelas['resultados'], df_vd_novo], ignore_index=True))
+    tabelas['participacoes'] = esquema.compactar_participacoes(
+        jogadores.concatenar([tabelas['participacoes'], novos['participacoes']]))
+    tabelas.update(agregados.somar_agregados(tabelas, novos))
+
+    # Os acumulados das rodadas novas continuam a partir dos totais já gravados
+    tabelas['acumulados'] = acumulados.encadear(
+        [tabelas['acumulados'], acumulados.acumular(novos['gols'], novos['participacoes'])])
+
+    return tabelas
+
+
+
+def ler_manifesto(diretorio):
+    '''
+        Retorna o manifesto da partição ou None se não existir
+    '''
+    try:
+        with open(os.path.join(diretorio, ARQUIVO_MANIFESTO), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+
+def assinatura_manifesto(ano, diretorio=DIR_COMPILADO):
+    '''
+        Hash do manifesto da partição da temporada (None se a partição não existe)
+    '''
+    manifesto = ler_manifesto(dir_particao(ano, diretorio))
+    if manifesto is None:
+        return None
+
+    conteudo = json.dumps(manifesto, sort_keys=True)
+
+    return hashlib.sha1(conteudo.encode('utf-8')).hexdigest()[:16]
+
+
+
+def particao_atualizada(ano, fontes=None, diretorio=DIR_COMPILADO):
+    '''
+        Indica se a partição da temporada existe, está na versão atual e foi
+        gerada a partir das planilhas como estão agora.
+        Se as planilhas da temporada não existem mais, a partição é mantida como está.
+    '''
+    particao = dir_particao(ano, diretorio)
+    manifesto = ler_manifesto(particao)
+    if manifesto is None or manifesto.get('versao') != VERSAO_ESQUEMA:
+        return False
+
+    for tabela in TABELAS:
+        if not os.path.exists(os.path.join(particao, f'{tabela}.arrow')):
+            return False
+
+    if fontes is None:
+        return True
+
+    for caminho in fontes.values():
+        if manifesto['fontes'].get(caminho) != list(assinatura_arquivo(caminho)):
+            return False
+
+    return True
+
+
+
+def gravar(ano, tabelas, fontes, diretorio=DIR_COMPILADO, linhas=None):
+    '''
+        Grava cada tabela da temporada como Arrow IPC (Feather v2) na sua partição
+        e, por último, o manifesto da partição.
+        Os arquivos são gravados sem compressão e em um único bloco para que possam
+        ser mapeados em memória sem cópia (ver utils.dados.ler_tabela_mapeada).
+        Enquanto o manifesto não é gravado, a partição é considerada
+        desatualizada e as páginas continuam lendo o Excel.
+        linhas: assinaturas do conteúdo das planilhas (ver compilar), usadas
+        por anexar para verificar se as rodadas gravadas foram editadas.
+    '''
+    particao = dir_particao(ano, diretorio)
+    os.makedirs(particao, exist_ok=True)
+
+    for tabela, df in tabelas.items():
+        caminho = os.path.join(particao, f'{tabela}.arrow')
+        feather.write_feather(df, caminho + '.tmp', compression='uncompressed', chunksize=max(len(df), 1))
+        os.replace(caminho + '.tmp', caminho)
+
+    manifesto = {
+        'versao': VERSAO_ESQUEMA,
+        'ano': ano,
+        'fontes': {caminho: list(assinatura_arquivo(caminho)) for caminho in fontes.values()},
+        'linhas': linhas
+    }
+    caminho = os.path.join(particao, ARQUIVO_MANIFESTO)
+    with open(caminho + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, indent=2, ensure_ascii=False)
+    os.replace(caminho + '.tmp', caminho)
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compila as planilhas das temporadas em Arrow IPC.')
+    parser.add_argument('--destino', default=DIR_COMPILADO, help='Diretório do armazenamento compilado')
+    parser.add_argument('--temporada', action='append', help='Temporada a compilar (pode ser repetido)')
+    parser.add_argument('--anexar', action='store_true', help='Processa apenas as rodadas novas de cada temporada')
+    parser.add_argument('--forcar', action='store_true', help='Regrava as partições mesmo sem alterações')
+    parser.add_argument('--sqlite', action='store_true', help=f'Também grava as temporadas no banco {banco.ARQUIVO_BANCO} do destino')
+    args = parser.parse_args()
+
+    temporadas = descobrir_temporadas()
+    if args.temporada:
+        temporadas = {ano: fontes for ano, fontes in temporadas.items() if ano in args.temporada}
+
+    # Sem o dicionário gravado, os identificadores de jogadores das partições
+    # existentes não são mais garantidos: recompila as temporadas
+    if not os.path.exists(os.path.join(args.destino, jogadores.ARQUIVO_DICIONARIO)):
+        args.forcar = True
+    dicionario = jogadores.ler_dicionario(args.destino)
+    caminho_banco = os.path.join(args.destino, banco.ARQUIVO_BANCO)
+
+    for ano, fontes in temporadas.items():
+        if not args.forcar and particao_atualizada(ano, fontes, args.destino):
+            print(f'{ano}: partição atualizada, nada a fazer')
+            if args.sqlite:
+                tabelas = ler_particao(ano, args.destino)
+                banco.gravar_temporada(ano, tabelas['gols'], tabelas['resultados'],
+                                       assinatura_manifesto(ano, args.destino), caminho_banco)
+                print(f'{ano}: gols e partidas -> {caminho_banco}')
+            continue
+
+        linhas = {}
+        tabelas = anexar(ano, fontes, args.destino, dicionario, linhas) if args.anexar else None
+        if tabelas is None:
+            if args.anexar:
+                print(f'{ano}: não foi possível anexar, compilando a temporada inteira')
+            tabelas = compilar(ano, fontes, dicionario, linhas)
+
+        # O dicionário é gravado antes da partição, que usa os seus identificadores
+        jogadores.gravar_dicionario(dicionario, args.destino)
+        gravar(ano, tabelas, fontes, args.destino, linhas)
+
+        for tabela, df in tabelas.items():
+            print(f'{ano}: {tabela}: {len(df)} linhas -> {dir_particao(ano, args.destino)}/{tabela}.arrow')
+
+        # O banco registra a versão da partição de origem (ver utils.dados.usar_banco)
+        if args.sqlite:
+            banco.gravar_temporada(ano, tabelas['gols'], tabelas['resultados'],
+                                   assinatura_manifesto(ano, args.destino), caminho_banco)
+            print(f'{ano}: gols e partidas -> {caminho_banco}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+'''
+    Dicionário de jogadores.
+
+    Cada nome normalizado (espaços nas pontas removidos e espaços internos
+    colapsados) recebe um identificador inteiro estável: a sua posição no
+    dicionário, gravado em dataset/compilado/jogadores.arrow e compartilhado por
+    todas as temporadas. O dicionário só cresce, então os identificadores já
+    atribuídos nunca mudam. O identificador 0 é reservado para "-" (gol sem
+    assistência).
+
+    As colunas de jogadores (Goleador, Assistente e Jogador) são categóricas
+    com as categorias do dicionário: os códigos das categorias são os
+    identificadores, de modo que comparações, junções e contagens rodam sobre
+    inteiros e os nomes só aparecem na exibição.
+'''
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from pandas.api.types import union_categoricals
+
+
+ARQUIVO_DICIONARIO = 'jogadores.arrow'
+
+# Identificador 0: gol sem assistência
+SEM_ASSISTENCIA = '-'
+
+# Colunas que guardam jogadores
+COLUNAS_JOGADORES = ['Goleador', 'Assistente', 'Jogador']
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def normalizar(nomes):
+    '''
+        Normaliza uma Series de nomes: remove os espaços das pontas e colapsa os
+        espaços internos. Nomes vazios viram NaN.
+    '''
+    nomes = nomes.astype(object).str.split().str.join(' ')
+
+    return nomes.mask(nomes == '')
+
+
+
+def ler_dicionario(diretorio):
+    '''
+        Retorna a lista de nomes do dicionário (o índice é o identificador)
+    '''
+    caminho = os.path.join(diretorio, ARQUIVO_DICIONARIO)
+    if not os.path.exists(caminho):
+        return [SEM_ASSISTENCIA]
+
+    return feather.read_table(caminho).column('Jogador').to_pylist()
+
+
+
+def gravar_dicionario(dicionario, diretorio):
+    '''
+        Grava o dicionário (colunas ID e Jogador) como Arrow IPC
+    '''
+    os.makedirs(diretorio, exist_ok=True)
+    tabela = pa.table({
+        'ID': pa.array(range(len(dicionario)), type=pa.int32()),
+        'Jogador': pa.array(dicionario, type=pa.string())
+    })
+
+    caminho = os.path.join(diretorio, ARQUIVO_DICIONARIO)
+    feather.write_feather(tabela, caminho + '.tmp', compression='uncompressed')
+    os.replace(caminho + '.tmp', caminho)
+
+
+
+def internar(tabelas, dicionario):
+    '''
+        Converte as colunas de jogadores (já normalizadas) de todas as tabelas
+        do dicionário {nome: DataFrame} em categóricas com as categorias do
+        dicionário de jogadores. Os nomes novos são acrescentados ao final do
+        dicionário (a lista é alterada), na ordem em que aparecem, antes da
+        conversão: assim todas as tabelas ficam com as mesmas categorias.
+    '''
+    conhecidos = set(dicionario)
+    for df in tabelas.values():
+        for coluna in COLUNAS_JOGADORES:
+            if coluna not in df.columns:
+                continue
+
+            for nome in df[coluna].dropna().unique():
+                if nome not in conhecidos:
+                    dicionario.append(nome)
+                    conhecidos.add(nome)
+
+    tipo = pd.CategoricalDtype(categories=dicionario)
+    for df in tabelas.values():
+        for coluna in COLUNAS_JOGADORES:
+            if coluna in df.columns:
+                df[coluna] = df[coluna].astype(object).astype(tipo)
+
+    return tabelas
+
+
+
+def concatenar(dfs):
+    '''
+        Concatena DataFrames com colunas de jogadores preservando os
+        identificadores: as categorias de todos começam pelo mesmo dicionário,
+        então a união delas mantém os códigos já atribuídos.
+    '''
+    df = pd.concat(dfs, ignore_index=True)
+
+    for coluna in COLUNAS_JOGADORES:
+        if coluna in df.columns:
+            df[coluna] = union_categoricals([d[coluna] for d in dfs], ignore_order=True)
+
+    return df
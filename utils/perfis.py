@@ -0,0 +1,91 @@
+'''
+    Tabela de perfis dos jogadores (card do jogador).
+
+    Uma linha por jogador, indexada por Jogador, com tudo o que o card exibe:
+    partidas, pontos, vitórias, empates, derrotas, gols, assistências e
+    participações diretas (gols + assistências). A tabela é montada para todos
+    os jogadores de uma vez, a partir das linhas filtradas (gols e
+    participações) ou dos totais pré-calculados (ver utils.acumulados e
+    utils.cubo), e o card de um jogador é a leitura de uma linha.
+'''
+import pandas as pd
+
+from utils import classificacao
+from utils.jogadores import SEM_ASSISTENCIA
+
+
+# Colunas do perfil, na ordem de exibição no card
+COLUNAS = ['Partidas', 'Pontos', 'Vitorias', 'Empates', 'Derrotas', 'Gols', 'Assistencias', 'Participacoes']
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def contar_gols(df):
+    '''
+        Retorna um DataFrame indexado por Jogador com as colunas Gols e
+        Assistencias dos gols informados ("-" indica gol sem assistência)
+    '''
+    gols = df.groupby('Goleador', observed=True).size().rename('Gols')
+    assistencias = df[df['Assistente'] != SEM_ASSISTENCIA].groupby('Assistente', observed=True).size().rename('Assistencias')
+    gols.index.name = assistencias.index.name = 'Jogador'
+
+    return pd.concat([gols, assistencias], axis=1)
+
+
+
+def completar(df_perfis):
+    '''
+        Calcula Pontos e Participacoes, preenche as contagens ausentes com zero
+        e retorna as COLUNAS do perfil
+    '''
+    df_perfis = classificacao.calcular_pontos(df_perfis.fillna(0).astype(int))
+    df_perfis['Participacoes'] = df_perfis['Gols'] + df_perfis['Assistencias']
+
+    return df_perfis[COLUNAS]
+
+
+
+def montar(df, df_participacoes, df_gols=None):
+    '''
+        Retorna a tabela de perfis a partir dos gols (df) e das participações
+        filtradas. df_gols: contagens de gols e assistências já calculadas
+        (ver utils.banco.contar_gols); por padrão, contadas em df.
+    '''
+    # Partidas e resultados de cada jogador da tabela de classificação das participações
+    df_resultados = classificacao.tabela_pontos(df_participacoes).set_index('Jogador')
+    df_resultados = df_resultados[['Partidas', 'Vitorias', 'Derrotas', 'Empates']]
+    df_resultados.index = df_resultados.index.astype(object)
+
+    if df_gols is None:
+        df_gols = contar_gols(df)
+    df_gols.index = df_gols.index.astype(object)
+
+    return completar(df_resultados.join(df_gols, how='outer'))
+
+
+
+def montar_agregados(df_totais):
+    '''
+        Retorna a tabela de perfis a partir dos totais por jogador (ver
+        utils.acumulados.ate e utils.cubo.totais_jogadores), sem reprocessar
+        as partidas
+    '''
+    df_perfis = df_totais.set_index('Jogador')[['Partidas', 'Vitorias', 'Derrotas', 'Empates', 'Gols', 'Assistencias']]
+    df_perfis.index = df_perfis.index.astype(object)
+
+    return completar(df_perfis)
+
+
+
+def perfil(df_perfis, jogador):
+    '''
+        Retorna a linha do jogador (Series com as COLUNAS), com zeros para
+        quem não tem partidas nem gols nos filtros atuais
+    '''
+    if jogador not in df_perfis.index:
+        return pd.Series(0, index=COLUNAS)
+
+    return df_perfis.loc[jogador]
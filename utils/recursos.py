@@ -0,0 +1,85 @@
+'''
+    Registro dos recursos estáticos (imagens e fontes) do dashboard.
+
+    Cada imagem é decodificada uma vez por processo e compartilhada por todas
+    as páginas e sessões (somente leitura: copie antes de desenhar sobre ela).
+    O logo da barra lateral fica pronto em PNG na largura da barra lateral,
+    então o st.sidebar.image não decodifica, redimensiona nem recodifica a
+    imagem a cada interação. As fontes TrueType ficam carregadas por
+    (arquivo, tamanho), como usadas no card do jogador (ver utils.cartao).
+'''
+import io
+from functools import lru_cache
+
+from PIL import Image, ImageFont
+
+
+CAMINHO_LOGO = 'images/logo.png'
+CAMINHO_JOGADOR = 'images/player.jpg'
+
+FONTE_ITALICA = 'fonts/source-sans-pr-boldItalic.ttf'
+FONTE_NEGRITO = 'fonts/source-sans-pro-bold.ttf'
+
+# Largura do logo na barra lateral (o dobro da largura padrão da barra, para telas de alta densidade)
+LARGURA_BARRA_LATERAL = 672
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+@lru_cache(maxsize=None)
+def imagem(caminho):
+    '''
+        Imagem decodificada uma vez por processo (somente leitura)
+    '''
+    img = Image.open(caminho)
+    img.load()
+
+    return img
+
+
+
+@lru_cache(maxsize=None)
+def imagem_redimensionada(caminho, largura):
+    '''
+        Variante da imagem com a largura informada (mantém a proporção; imagens
+        mais estreitas não são ampliadas)
+    '''
+    img = imagem(caminho)
+    if img.width <= largura:
+        return img
+
+    altura = round(img.height * largura / img.width)
+
+    return img.resize((largura, altura), Image.LANCZOS)
+
+
+
+@lru_cache(maxsize=None)
+def imagem_png(caminho, largura):
+    '''
+        Variante redimensionada da imagem codificada em PNG (bytes), pronta para o st.image
+    '''
+    buffer = io.BytesIO()
+    imagem_redimensionada(caminho, largura).save(buffer, format='PNG', optimize=True)
+
+    return buffer.getvalue()
+
+
+
+def logo_barra_lateral():
+    '''
+        Logo do dashboard na largura da barra lateral (PNG)
+    '''
+    return imagem_png(CAMINHO_LOGO, LARGURA_BARRA_LATERAL)
+
+
+
+@lru_cache(maxsize=None)
+def fonte(caminho, tamanho):
+    '''
+        Fonte TrueType no tamanho informado, carregada uma vez por processo
+    '''
+    return ImageFont.truetype(caminho, size=tamanho)
@@ -0,0 +1,71 @@
+'''
+    Tema escuro dos gráficos do dashboard (template Plotly registrado).
+
+    As cores, a grade, o título e as barras sem bordas (as mesmas propriedades
+    que as páginas aplicavam em cada figura) ficam no template TEMPLATE,
+    registrado uma vez em plotly.io.templates ao importar o módulo. As figuras
+    recebem o template pelo nome na criação (px.bar(..., template=TEMPLATE),
+    go.Figure(layout=dict(template=TEMPLATE))), sem reaplicar e revalidar o
+    estilo em cada figura; depois só o título é definido (ver titulo).
+
+    Todas as figuras com o tema são exibidas com st.plotly_chart(fig,
+    theme=None): com o tema do Streamlit, o navegador mescla as cores e fontes
+    do Streamlit no template da figura e sobrescreve as do dashboard. Sem o tema do Streamlit,
+    o navegador preenche o fundo da área do gráfico (plot_bgcolor) com a cor
+    secundária do tema quando a figura não define a cor no próprio layout, por
+    isso o fundo também é definido em titulo.
+'''
+import plotly.graph_objects as go
+import plotly.io as pio
+
+
+TEMPLATE = 'futsal'
+
+COR_TEXTO = '#ffffff'
+COR_GRADE = '#222C36'
+COR_DESTAQUE = '#C5D92A'
+TRANSPARENTE = 'rgba(0,0,0,0)'
+
+EIXO = dict(
+    title_font=dict(color=COR_TEXTO),
+    tickfont=dict(color=COR_TEXTO),
+    gridcolor=COR_GRADE
+)
+
+pio.templates[TEMPLATE] = go.layout.Template(
+    layout=dict(
+        font=dict(color=COR_TEXTO),
+        paper_bgcolor=TRANSPARENTE,
+        plot_bgcolor=TRANSPARENTE,
+        colorway=[COR_DESTAQUE],
+        title=dict(
+            y=0.95,
+            x=0.5,
+            xanchor='center',
+            yanchor='top',
+            font=dict(color=COR_TEXTO, size=20)
+        ),
+        xaxis=EIXO,
+        yaxis=EIXO,
+        legend=dict(font=dict(color=COR_TEXTO))
+    ),
+    data=dict(
+        # Barras sem bordas
+        bar=[go.Bar(marker=dict(line=dict(color=TRANSPARENTE, width=0)))]
+    )
+)
+
+
+# =====================================
+# Funções
+# =====================================
+
+
+def titulo(fig, texto):
+    '''
+        Define o título da figura criada com o TEMPLATE (e o fundo da área do
+        gráfico, ver a descrição do módulo)
+    '''
+    fig.update_layout(title_text=texto, plot_bgcolor=TRANSPARENTE)
+
+    return fig